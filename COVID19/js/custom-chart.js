@@ -61,65 +61,42 @@ export function initInflectionChart() {
 
     console.log('📊 변곡점 분석 차트 로딩 중...');
 
-    // CSV 데이터 로드
-    Papa.parse('data/covid19_monthly_cases_by_country.csv', {
-        download: true,
-        header: true,
-        dynamicTyping: true,
-        skipEmptyLines: true,
-        complete: function (results) {
-            const data = results.data;
-            if (!data || data.length === 0) {
-                console.error("데이터 로드 실패");
-                return;
-            }
-            renderInflectionChart(canvas, data);
-        },
-        error: function (err) {
-            console.error("CSV 에러:", err);
-        }
-    });
+    // 서버에서 미리 만든 국가 × 월 행렬 로드 (covid19_streamlit/monthly.py가 생성)
+    fetch('data/covid19_monthly_matrix.json')
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .then(matrix => renderInflectionChart(canvas, matrix))
+        .catch(err => console.error("월간 데이터 로드 실패:", err));
 }
 
-function renderInflectionChart(canvas, rawData) {
-    // 1. 데이터 가공
+function renderInflectionChart(canvas, matrix) {
+    // 1. 인덱스 준비 (국가/월 → 행/열 번호)
     const countries = Object.keys(inflectionData);
-    const countryDataMap = {};
-
-    countries.forEach(country => {
-        countryDataMap[country] = rawData
-            .filter(row => row.Country === country)
-            .sort((a, b) => new Date(a.year_month) - new Date(b.year_month));
-    });
-
-    // X축 라벨 생성
-    let allDates = new Set();
-    Object.values(countryDataMap).forEach(rows => {
-        rows.forEach(r => allDates.add(r.year_month));
-    });
-    const labels = Array.from(allDates).sort();
+    const labels = matrix.months;
+    const countryIndex = {};
+    matrix.countries.forEach((country, i) => { countryIndex[country] = i; });
+    const monthIndex = {};
+    labels.forEach((month, i) => { monthIndex[month] = i; });
 
     // 2. 차트 데이터셋 생성
     const datasets = [];
 
     countries.forEach(country => {
-        const rows = countryDataMap[country];
-        if (!rows || rows.length === 0) return;
+        const row = countryIndex[country];
+        if (row === undefined) return;
+        const cumulative = matrix.cumulative[row];
 
         const color = countryColors[country];
         // [수정] 한글 이름 적용
         const koName = countryNameMap[country] || country;
 
-        // (1) 기본 라인 차트 데이터 생성
-        const lineData = labels.map(date => {
-            const row = rows.find(r => r.year_month === date);
-            return row ? row.Cumulative_cases : null;
-        });
-
+        // (1) 기본 라인 차트 데이터 (행 하나를 그대로 사용)
         datasets.push({
             type: 'line',
             label: koName, // 한글 이름 사용
-            data: lineData,
+            data: cumulative,
             borderColor: color,
             backgroundColor: color,
             borderWidth: 2,
@@ -129,20 +106,15 @@ function renderInflectionChart(canvas, rawData) {
             yAxisID: 'y'
         });
 
-        // (2) 변곡점 마커 데이터 생성
-        const scatterData = labels.map(date => {
-            const point = inflectionData[country].find(p => date.startsWith(p.date));
-            if (point) {
-                const row = rows.find(r => r.year_month === date);
-                return row ? row.Cumulative_cases : null;
-            }
-            return null;
-        });
-
+        // (2) 변곡점 마커 데이터 (이벤트 월의 열 번호로 바로 찾음)
+        const scatterData = new Array(labels.length).fill(null);
         // 툴팁용 메타 데이터
-        const tooltips = labels.map(date => {
-            const point = inflectionData[country].find(p => date.startsWith(p.date));
-            return point ? point.reason : null;
+        const tooltips = new Array(labels.length).fill(null);
+        inflectionData[country].forEach(point => {
+            const col = monthIndex[point.date];
+            if (col === undefined) return;
+            scatterData[col] = cumulative[col];
+            tooltips[col] = point.reason;
         });
 
         datasets.push({
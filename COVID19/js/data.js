@@ -39,40 +39,102 @@ function loadCsv(path) {
 }
 
 // [추가] disease.sh API에서 데이터 로드
-async function loadCompactFromAPI() {
-    try {
-        console.log("Loading timeline from disease.sh API...");
-        const response = await fetch('https://disease.sh/v3/covid-19/historical/all?lastdays=all');
+// 받은 타임라인은 localStorage에 두고, 다음부터는 마지막으로 받은 날 이후만 요청해서 뒤에 붙임
+const TIMELINE_API = 'https://disease.sh/v3/covid-19/historical/all';
+const TIMELINE_STORAGE_KEY = 'covid19_timeline_v1';
+const DAY_MS = 86400000;
+
+function formatApiDate(date) {
+    const [month, day, year] = date.split('/');
+    const fullYear = year.length === 2 ? `20${year}` : year;
+    return `${fullYear}-${month.padStart(2, '0')}-${day.padStart(2, '0')}`;
+}
 
-        if (!response.ok) {
-            throw new Error(`API Error: ${response.status}`);
-        }
+async function fetchTimeline(lastdays) {
+    const response = await fetch(`${TIMELINE_API}?lastdays=${lastdays}`);
 
-        const data = await response.json();
+    if (!response.ok) {
+        throw new Error(`API Error: ${response.status}`);
+    }
 
-        const timeline = [];
-        const dates = Object.keys(data.cases);
+    const data = await response.json();
 
-        dates.forEach(date => {
-            const [month, day, year] = date.split('/');
-            const fullYear = year.length === 2 ? `20${year}` : year;
-            const formattedDate = `${fullYear}-${month.padStart(2, '0')}-${day.padStart(2, '0')}`;
+    return Object.keys(data.cases).map(date => ({
+        date: formatApiDate(date),
+        cases: data.cases[date] || 0,
+        deaths: data.deaths[date] || 0,
+        new_cases: data.cases[date] || 0,
+        new_deaths: data.deaths[date] || 0
+    }));
+}
 
-            timeline.push({
-                date: formattedDate,
-                cases: data.cases[date] || 0,
-                deaths: data.deaths[date] || 0,
-                new_cases: data.cases[date] || 0,
-                new_deaths: data.deaths[date] || 0
-            });
-        });
+// { rows: [...], checkedAt: 마지막으로 API를 확인한 시각(ms) }
+function readStoredTimeline() {
+    try {
+        const stored = JSON.parse(localStorage.getItem(TIMELINE_STORAGE_KEY));
+        return stored && Array.isArray(stored.rows) && stored.rows.length > 0 ? stored : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+function saveTimeline(rows) {
+    try {
+        localStorage.setItem(TIMELINE_STORAGE_KEY, JSON.stringify({ rows, checkedAt: Date.now() }));
+    } catch (error) {
+        // 저장 공간이 없으면 다음에 다시 전체를 받음
+        console.warn('타임라인 저장 실패:', error);
+    }
+}
+
+// 저장된 마지막 날과 겹치는 행의 누적값이 같고, 새 누적값이 줄지 않으면 새 행만 반환 (맞지 않으면 null)
+function newRowsAfter(stored, fetched) {
+    const last = stored[stored.length - 1];
+    const overlap = fetched.find(r => r.date === last.date);
+    if (!overlap || overlap.cases !== last.cases || overlap.deaths !== last.deaths) {
+        return null;
+    }
+    const rows = fetched.filter(r => r.date > last.date);
+    let prev = last;
+    for (const r of rows) {
+        if (r.cases < prev.cases || r.deaths < prev.deaths) return null;
+        prev = r;
+    }
+    return rows;
+}
+
+async function loadCompactFromAPI() {
+    try {
+        const stored = readStoredTimeline();
+        let timeline;
+
+        if (stored) {
+            // lastdays는 API의 최신 날짜부터 거꾸로 세므로, 지난 확인 이후 지난 날수 + 1이면
+            // 저장된 마지막 날이 항상 포함됨 (마지막 날은 검증용으로 한 번 더 받음)
+            const lastdays = Math.max(1, Math.ceil((Date.now() - stored.checkedAt) / DAY_MS) + 1);
+            console.log(`Loading timeline from disease.sh API (lastdays=${lastdays})...`);
+            const rows = newRowsAfter(stored.rows, await fetchTimeline(lastdays));
+            if (rows) {
+                timeline = rows.length > 0 ? stored.rows.concat(rows) : stored.rows;
+                console.log(`✓ API 데이터 증분 로드: ${rows.length}개 날짜 추가`);
+            }
+        }
+
+        if (!timeline) {
+            // 처음이거나 원본이 과거 값을 고쳤으면 전체를 다시 받음
+            console.log("Loading timeline from disease.sh API...");
+            timeline = await fetchTimeline('all');
+            console.log(`✓ API 데이터 로드 완료: ${timeline.length}개 날짜`);
+        }
 
-        console.log(`✓ API 데이터 로드 완료: ${timeline.length}개 날짜`);
+        saveTimeline(timeline);
         return timeline;
 
     } catch (error) {
         console.error('API 로드 실패:', error);
-        return [];
+        // 네트워크가 안 되면 저장된 타임라인이라도 사용
+        const stored = readStoredTimeline();
+        return stored ? stored.rows : [];
     }
 }
 
@@ -1,84 +1,67 @@
-import pandas as pd
-import plotly.express as px
+import country_reports
+import kaggle_data
+import pipeline
+import report
+
+# 분석 단계: 로딩 → 국가 필터링 → 그래프.
+# 각 단계 결과는 .pipeline_cache/에 저장되고, CSV나 단계 코드가 바뀐 부분만 다시 계산됨
+p = pipeline.Pipeline("country_bar")
+p.source("csv", "country_wise_latest.csv")
+
 
 # 0) 데이터 로딩
-df = pd.read_csv("country_wise_latest.csv")
+@p.step("csv")
+def standardized(csv_path):
+    return kaggle_data.load(csv_path)
+
+
+# 2) 국가 필터링
+@p.step("standardized")
+def country_data(df):
+    # 국가 인덱스로 표기 차이("Korea, South" / "South Korea" / "KOR")를 흡수해서 행 위치를 바로 찾음
+    countries = kaggle_data.country_index()
+    position = countries.positions(df["country"]).get(countries.resolve("Korea, South"))
+    return df.iloc[[position]] if position is not None else df.iloc[0:0]
+
+
+# 3) 데이터 가공
+@p.step("country_data")
+def plot_data(country_data):
+    # 그래프/데이터 구성은 전체 국가 일괄 생성(country_reports.py)과 같은 함수를 씀
+    if country_data.empty:
+        return None
+    return country_reports.plot_data(country_data[list(country_reports.METRICS.values())].values[0])
 
-# 1) 컬럼 표준화
-df = df.rename(columns={
-    "Country/Region": "country",
-    "Confirmed": "cum_confirmed",
-    "Deaths": "cum_deaths",
-    "Recovered": "cum_recovered",
-    "Active": "active",
-    "New cases": "new_confirmed",
-    "New deaths": "new_deaths",
-    "New recovered": "new_recovered",
-    "WHO Region": "who_region"
-})
+
+# 4) 시각화
+@p.step("country_data", "plot_data")
+def fig_country_bar(country_data, plot_data):
+    if plot_data is None:
+        return None
+    return country_reports.country_figure(str(country_data["country"].iloc[0]), plot_data)
+
+
+outputs = p.run("standardized", "country_data", "plot_data", "fig_country_bar")
+df = outputs["standardized"]
+country_data = outputs["country_data"]
 
 # 데이터 확인 (디버깅용)
 print("데이터셋의 국가명 샘플:")
 print(df["country"].head(20))
 print(f"\n'Korea, South' 존재 여부: {'Korea, South' in df['country'].values}")
 
-# 2) 국가 필터링
 country_name = "Korea, South"
-country_data = df[df["country"] == country_name]
+if not country_data.empty and country_data["country"].iloc[0] != country_name:
+    country_name = country_data["country"].iloc[0]
+    countries = kaggle_data.country_index()
+    print(f"\n'{country_name}' 사용 ({countries.iso3_of(countries.resolve(country_name))})")
 
-# 국가 데이터가 없으면 가능한 한국 관련 국가명 찾기
-if country_data.empty:
-    korea_matches = df[df["country"].str.contains("Korea", case=False, na=False)]
-    print("\n한국 관련 국가명:")
-    print(korea_matches["country"].values)
-    if not korea_matches.empty:
-        country_name = korea_matches.iloc[0]["country"]
-        country_data = korea_matches.iloc[0:1]
-        print(f"\n'{country_name}' 사용")
-
-# 3) 데이터 가공
 if not country_data.empty:
-    # 딕셔너리 형태로 데이터 재구성
-    plot_data = pd.DataFrame({
-        "metric_label": ["Confirmed", "Deaths", "Recovered"],
-        "value": [
-            country_data["cum_confirmed"].values[0],
-            country_data["cum_deaths"].values[0],
-            country_data["cum_recovered"].values[0]
-        ]
-    })
-    
     print(f"\n{country_name} 데이터:")
-    print(plot_data)
-    
-    # 4) 시각화
-    color_map = {
-        "Confirmed": "#1f77b4", 
-        "Deaths": "#ef553b",    
-        "Recovered": "#00cc96"  
-    }
-    
-    fig_country_bar = px.bar(
-        plot_data,
-        x="metric_label",
-        y="value",
-        color="metric_label",
-        color_discrete_map=color_map,
-        title=f"{country_name} - Cumulative COVID-19 Statistics",
-        labels={"metric_label": "Metric", "value": "Count"},
-        text_auto=True
-    )
-    
-    # 레이아웃 개선
-    fig_country_bar.update_layout(
-        showlegend=False,
-        xaxis_title="",
-        yaxis_title="Number of Cases",
-        height=500
-    )
-    
-    fig_country_bar.show(renderer="browser")
+    print(outputs["plot_data"])
+
+    report.show(outputs["fig_country_bar"])
 else:
     print(f"\n오류: '{country_name}' 데이터를 찾을 수 없습니다.")
     print("사용 가능한 국가 목록:")
-    print(df["country"].sort_values().unique())
\ No newline at end of file
+    print(df["country"].sort_values().unique())
@@ -1,148 +1,159 @@
-import pandas as pd
 import plotly.graph_objects as go
 
-# 데이터 로딩 (로컬 경로로 수정)
-df = pd.read_csv("country_wise_latest.csv")
-
-# 컬럼 표준화
-df = df.rename(columns={
-    "Country/Region": "country",
-    "Confirmed": "cum_confirmed",
-    "Deaths": "cum_deaths",
-    "Recovered": "cum_recovered",
-    "Active": "active",
-    "New cases": "new_confirmed",
-    "New deaths": "new_deaths",
-    "New recovered": "new_recovered",
-    "WHO Region": "who_region"
-})
-
-# 국가명 기준으로 정렬 (알파벳 순)
-df = df.sort_values("country").reset_index(drop=True)
-
-# Plotly 그래프 객체 생성
-fig = go.Figure()
-
-# Confirmed (파란색) 막대 추가
-fig.add_trace(go.Bar(
-    name='Confirmed',
-    x=df['country'],
-    y=df['cum_confirmed'],
-    marker_color='#1f77b4',
-    text=df['cum_confirmed'],
-    textposition='auto',
-))
-
-# Deaths (빨간색) 막대 추가
-fig.add_trace(go.Bar(
-    name='Deaths',
-    x=df['country'],
-    y=df['cum_deaths'],
-    marker_color='#ef553b',
-    text=df['cum_deaths'],
-    textposition='auto',
-))
-
-# Recovered (녹색) 막대 추가
-fig.add_trace(go.Bar(
-    name='Recovered',
-    x=df['country'],
-    y=df['cum_recovered'],
-    marker_color='#00cc96',
-    text=df['cum_recovered'],
-    textposition='auto',
-))
-
-# 레이아웃 설정
-fig.update_layout(
-    title={
-        'text': 'COVID-19 Global Statistics by Country<br><sub>Cumulative Confirmed, Deaths, and Recovered Cases</sub>',
-        'x': 0.5,
-        'xanchor': 'center'
-    },
-    xaxis_title='Country',
-    yaxis_title='Number of Cases',
-    barmode='group',  # 막대를 그룹으로 나란히 배치
-    height=600,
-    width=1800,
-    showlegend=True,
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="right",
-        x=1
-    ),
-    xaxis=dict(
-        tickangle=-45,
-        tickfont=dict(size=10)
-    ),
-    hovermode='x unified'
-)
+import kaggle_data
+import pipeline
+import report
+
+# 분석 단계: 로딩 → 순위 → 그래프.
+# 각 단계 결과는 .pipeline_cache/에 저장되고, CSV나 단계 코드가 바뀐 부분만 다시 계산됨
+p = pipeline.Pipeline("top20_countries_001")
+p.source("csv", "country_wise_latest.csv")
+
+
+@p.step("csv")
+def standardized(csv_path):
+    # 데이터 로딩
+    return kaggle_data.load(csv_path)
+
+
+@p.step("standardized")
+def top20_cases(df):
+    # 확진자 수 기준 상위 20개 국가
+    return df.nlargest(20, 'cum_confirmed')
+
+
+@p.step("standardized")
+def fig_all(df):
+    # Plotly 그래프 객체 생성
+    fig = go.Figure()
+
+    # Confirmed (파란색) 막대 추가
+    fig.add_trace(go.Bar(
+        name='Confirmed',
+        x=df['country'],
+        y=df['cum_confirmed'],
+        marker_color='#1f77b4',
+        text=df['cum_confirmed'],
+        textposition='auto',
+    ))
+
+    # Deaths (빨간색) 막대 추가
+    fig.add_trace(go.Bar(
+        name='Deaths',
+        x=df['country'],
+        y=df['cum_deaths'],
+        marker_color='#ef553b',
+        text=df['cum_deaths'],
+        textposition='auto',
+    ))
+
+    # Recovered (녹색) 막대 추가
+    fig.add_trace(go.Bar(
+        name='Recovered',
+        x=df['country'],
+        y=df['cum_recovered'],
+        marker_color='#00cc96',
+        text=df['cum_recovered'],
+        textposition='auto',
+    ))
+
+    # 레이아웃 설정
+    fig.update_layout(
+        title={
+            'text': 'COVID-19 Global Statistics by Country<br><sub>Cumulative Confirmed, Deaths, and Recovered Cases</sub>',
+            'x': 0.5,
+            'xanchor': 'center'
+        },
+        xaxis_title='Country',
+        yaxis_title='Number of Cases',
+        barmode='group',  # 막대를 그룹으로 나란히 배치
+        height=600,
+        width=1800,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        xaxis=dict(
+            tickangle=-45,
+            tickfont=dict(size=10)
+        ),
+        hovermode='x unified'
+    )
+    return fig
 
-# 브라우저에서 그래프 표시
-fig.show(renderer="browser")
 
 # 추가: 상위 20개 국가만 보는 그래프
+@p.step("top20_cases")
+def fig_top20(df_top20):
+    fig_top20 = go.Figure()
+
+    fig_top20.add_trace(go.Bar(
+        name='Confirmed',
+        x=df_top20['country'],
+        y=df_top20['cum_confirmed'],
+        marker_color='#1f77b4',
+        text=df_top20['cum_confirmed'],
+        textposition='auto',
+    ))
+
+    fig_top20.add_trace(go.Bar(
+        name='Deaths',
+        x=df_top20['country'],
+        y=df_top20['cum_deaths'],
+        marker_color='#ef553b',
+        text=df_top20['cum_deaths'],
+        textposition='auto',
+    ))
+
+    fig_top20.add_trace(go.Bar(
+        name='Recovered',
+        x=df_top20['country'],
+        y=df_top20['cum_recovered'],
+        marker_color='#00cc96',
+        text=df_top20['cum_recovered'],
+        textposition='auto',
+    ))
+
+    fig_top20.update_layout(
+        title={
+            'text': 'COVID-19 Top 20 Countries by Confirmed Cases<br><sub>Cumulative Statistics</sub>',
+            'x': 0.5,
+            'xanchor': 'center'
+        },
+        xaxis_title='Country',
+        yaxis_title='Number of Cases',
+        barmode='group',
+        height=600,
+        width=1400,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        xaxis=dict(
+            tickangle=-45,
+            tickfont=dict(size=11)
+        ),
+        hovermode='x unified'
+    )
+    return fig_top20
+
+
+outputs = p.run("standardized", "fig_all", "fig_top20")
+df = outputs["standardized"]
+
+# 브라우저에서 그래프 표시
+report.show(outputs["fig_all"])
+
 print("\n=== 상위 20개 국가 (확진자 수 기준) ===")
-df_top20 = df.nlargest(20, 'cum_confirmed')
-
-fig_top20 = go.Figure()
-
-fig_top20.add_trace(go.Bar(
-    name='Confirmed',
-    x=df_top20['country'],
-    y=df_top20['cum_confirmed'],
-    marker_color='#1f77b4',
-    text=df_top20['cum_confirmed'],
-    textposition='auto',
-))
-
-fig_top20.add_trace(go.Bar(
-    name='Deaths',
-    x=df_top20['country'],
-    y=df_top20['cum_deaths'],
-    marker_color='#ef553b',
-    text=df_top20['cum_deaths'],
-    textposition='auto',
-))
-
-fig_top20.add_trace(go.Bar(
-    name='Recovered',
-    x=df_top20['country'],
-    y=df_top20['cum_recovered'],
-    marker_color='#00cc96',
-    text=df_top20['cum_recovered'],
-    textposition='auto',
-))
-
-fig_top20.update_layout(
-    title={
-        'text': 'COVID-19 Top 20 Countries by Confirmed Cases<br><sub>Cumulative Statistics</sub>',
-        'x': 0.5,
-        'xanchor': 'center'
-    },
-    xaxis_title='Country',
-    yaxis_title='Number of Cases',
-    barmode='group',
-    height=600,
-    width=1400,
-    showlegend=True,
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="right",
-        x=1
-    ),
-    xaxis=dict(
-        tickangle=-45,
-        tickfont=dict(size=11)
-    ),
-    hovermode='x unified'
-)
-
-fig_top20.show(renderer="browser")
+report.show(outputs["fig_top20"])
 
 print(f"\n총 {len(df)}개 국가의 데이터를 시각화했습니다.")
 print(f"상위 20개 국가만 별도로 표시했습니다.")
\ No newline at end of file
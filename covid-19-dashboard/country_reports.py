@@ -0,0 +1,221 @@
+# country_reports.py 국가별 누적 통계(Confirmed/Deaths/Recovered) 리포트를 모든 국가에 대해 한 번에 생성
+#
+#   python country_reports.py                       # country_wise_latest.csv의 모든 국가
+#   python country_reports.py --dataset full_grouped  # 일별 데이터의 국가별 마지막 날짜
+#   python country_reports.py --countries KOR USA "Korea, South"
+#
+# 데이터는 부모 프로세스에서 한 번만 읽고, 작업 프로세스는 fork로 그 배열을 그대로 물려받음
+# (작업에는 행 번호만 넘김). 국가별 HTML은 끝나는 대로 바로 쓰고, plotly.js는 폴더에 한 번만 둠
+
+import argparse
+import html
+import multiprocessing
+import os
+import re
+import time
+
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+import kaggle_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, "country_reports")
+
+METRICS = {
+    "Confirmed": "cum_confirmed",
+    "Deaths": "cum_deaths",
+    "Recovered": "cum_recovered",
+}
+
+COLOR_MAP = {
+    "Confirmed": "#1f77b4",
+    "Deaths": "#ef553b",
+    "Recovered": "#00cc96"
+}
+
+# 작업 프로세스가 읽는 데이터 (fork면 부모가 채운 값을 그대로 물려받음)
+_countries = None
+_values = None
+
+# 작업 프로세스별로 한 번 만든 그래프 틀 (px.bar를 국가마다 다시 부르지 않음)
+_template = None
+
+
+def plot_data(values):
+    """[확진, 사망, 완치] → 그래프용 데이터프레임"""
+    return pd.DataFrame({
+        "metric_label": list(METRICS),
+        "value": list(values)
+    })
+
+
+def country_figure(country_name, data):
+    """국가 하나의 누적 통계 막대 그래프 (Covid19_kds_Kaggle_20260204_001.py와 같은 모양)"""
+    fig = px.bar(
+        data,
+        x="metric_label",
+        y="value",
+        color="metric_label",
+        color_discrete_map=COLOR_MAP,
+        title=f"{country_name} - Cumulative COVID-19 Statistics",
+        labels={"metric_label": "Metric", "value": "Count"},
+        text_auto=True
+    )
+    fig.update_layout(
+        showlegend=False,
+        xaxis_title="",
+        yaxis_title="Number of Cases",
+        height=500
+    )
+    return fig
+
+
+def load_latest(dataset="latest"):
+    """
+    국가별 최신 누적 값 (country, cum_confirmed, cum_deaths, cum_recovered).
+    일별 데이터(full_grouped)는 국가별 마지막 날짜 행을 씀
+    """
+    if dataset == "full_grouped":
+        df = kaggle_data.load_full_grouped()
+        # 국가, 날짜 순으로 정렬돼 있으므로 국가별 마지막 행이 최신
+        df = df.groupby("country", observed=True, sort=False).tail(1)
+    else:
+        df = kaggle_data.load_country_wise_latest()
+    return df[["country", *METRICS.values()]].reset_index(drop=True)
+
+
+def _file_name(country_name, country_index):
+    """ISO-3 코드가 있으면 그걸로 (KOR.html), 없으면 국가명을 파일 이름으로 바꿔서 씀"""
+    country_id = country_index.resolve(country_name, None)
+    if country_id is not None:
+        return f"{country_index.iso3_of(country_id)}.html"
+    return re.sub(r"[^0-9A-Za-z]+", "_", country_name).strip("_") + ".html"
+
+
+def _init_worker(countries, values):
+    # fork면 이미 물려받은 값과 같은 객체. spawn(fork가 없는 OS)일 때만 실제로 전달됨
+    global _countries, _values
+    _countries, _values = countries, values
+
+
+def _country_spec(country_name, values):
+    """
+    country_figure와 같은 그래프를 dict로. 틀은 한 번만 만들고 국가마다 값과 제목만 바꿈
+    (px.bar + 검증이 국가당 시간의 대부분이라서)
+    """
+    global _template
+    if _template is None:
+        _template = country_figure("", plot_data([0] * len(METRICS))).to_dict()
+    return {
+        "data": [dict(trace, y=[value]) for trace, value in zip(_template["data"], values)],
+        "layout": dict(_template["layout"], title={"text": f"{country_name} - Cumulative COVID-19 Statistics"}),
+    }
+
+
+def _render(job):
+    """작업 프로세스: 행 하나를 HTML로 써서 (국가명, 파일 이름, 값) 반환"""
+    position, file_name, output_dir = job
+    country_name = _countries[position]
+    values = _values[position].tolist()
+    pio.write_html(_country_spec(country_name, values), os.path.join(output_dir, file_name),
+                   include_plotlyjs="directory", validate=False)
+    return country_name, file_name, values
+
+
+def write_index(output_dir, rows, elapsed):
+    """국가 목록 페이지 (확진자 많은 순)"""
+    items = "".join(
+        f'<tr><td><a href="{html.escape(file_name)}">{html.escape(name)}</a></td>'
+        + "".join(f"<td>{value:,}</td>" for value in values)
+        + "</tr>"
+        for name, file_name, values in sorted(rows, key=lambda row: -row[2][0])
+    )
+    headers = "".join(f"<th>{label}</th>" for label in METRICS)
+    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<title>COVID-19 국가별 리포트</title>
+<style>body {{ font-family: sans-serif; margin: 24px; }} td, th {{ padding: 2px 12px; text-align: right; }} td:first-child {{ text-align: left; }}</style>
+</head>
+<body>
+<h1>COVID-19 국가별 리포트</h1>
+<p>국가 {len(rows)}개 · 생성 {time.strftime('%Y-%m-%d %H:%M:%S')} · {elapsed:.1f}초</p>
+<table>
+<tr><th>Country</th>{headers}</tr>
+{items}
+</table>
+</body>
+</html>
+""")
+
+
+def export(output_dir=DEFAULT_OUTPUT_DIR, dataset="latest", countries=None, max_workers=None, verbose=True):
+    """
+    국가별 리포트를 프로세스 풀에서 생성. countries를 주면 그 국가만 (이름/별칭/ISO-3 코드).
+    반환: [(국가명, 파일 이름, [확진, 사망, 완치])]
+    """
+    global _countries, _values
+    started = time.perf_counter()
+    df = load_latest(dataset)
+    country_index = kaggle_data.country_index()
+
+    if countries:
+        positions = country_index.positions(df["country"])
+        selected = []
+        for name in countries:
+            position = positions.get(country_index.resolve(name))
+            if position is None:
+                raise KeyError(f"데이터에 없는 국가: {name}")
+            # 같은 국가의 다른 표기(KOR / "South Korea" / 한국)는 한 번만 (같은 파일을 동시에 쓰지 않게)
+            if position not in selected:
+                selected.append(position)
+    else:
+        selected = range(len(df))
+
+    # 작업 프로세스가 물려받을 데이터: 국가명 리스트와 (국가 × 지표) 정수 배열
+    _countries = df["country"].astype(str).tolist()
+    _values = df[list(METRICS.values())].to_numpy(dtype="int64")
+
+    os.makedirs(output_dir, exist_ok=True)
+    # 'directory' 모드가 각 작업에서 plotly.min.js를 동시에 복사하지 않도록 미리 한 번 써 둠
+    bundle_path = os.path.join(output_dir, "plotly.min.js")
+    if not os.path.exists(bundle_path):
+        with open(bundle_path, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+
+    jobs = [(position, _file_name(_countries[position], country_index), output_dir) for position in selected]
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    rows = []
+    with context.Pool(workers, initializer=_init_worker, initargs=(_countries, _values)) as pool:
+        for row in pool.imap_unordered(_render, jobs, chunksize=chunksize):
+            rows.append(row)
+            if verbose:
+                print(f"[{len(rows)}/{len(jobs)}] {row[0]} -> {row[1]}")
+
+    write_index(output_dir, rows, time.perf_counter() - started)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="모든 국가의 누적 통계 리포트를 정적 폴더로 내보내기")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--dataset", default="latest", choices=["latest", "full_grouped"])
+    parser.add_argument("--countries", nargs="*", help="이 국가만 생성 (이름, 별칭, ISO-3 코드)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rows = export(args.output_dir, args.dataset, args.countries, args.workers, verbose=not args.quiet)
+    print(f"국가 {len(rows)}개 -> {os.path.join(args.output_dir, 'index.html')} ({time.perf_counter() - started:.1f}초)")
@@ -0,0 +1,130 @@
+# kaggle_data.py Kaggle COVID-19 데이터 공통 로더 (컬럼 표준화 + 명시적 dtype + parquet 사이드카 캐시)
+
+import os
+import sys
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 국가 이름 인덱스와 압축 단계는 Streamlit 앱과 같은 모듈(covid19_streamlit/)을 씀
+STREAMLIT_DIR = os.path.join(BASE_DIR, "..", "covid19_streamlit")
+if STREAMLIT_DIR not in sys.path:
+    sys.path.append(STREAMLIT_DIR)
+
+import compact
+import countries
+
+# 원본 컬럼명 → 표준 컬럼명 (모든 스크립트가 같은 이름을 씀)
+RENAME = {
+    "Date": "date",
+    "Country/Region": "country",
+    "Confirmed": "cum_confirmed",
+    "Deaths": "cum_deaths",
+    "Recovered": "cum_recovered",
+    "Active": "active",
+    "New cases": "new_confirmed",
+    "New deaths": "new_deaths",
+    "New recovered": "new_recovered",
+    "Deaths / 100 Cases": "deaths_per_100_cases",
+    "Recovered / 100 Cases": "recovered_per_100_cases",
+    "Deaths / 100 Recovered": "deaths_per_100_recovered",
+    "Confirmed last week": "confirmed_last_week",
+    "1 week change": "week_change",
+    "1 week % increase": "week_pct_increase",
+    "WHO Region": "who_region"
+}
+
+# 원본 컬럼별 dtype. 국가/지역은 반복되는 문자열이라 category, 건수는 int32 (읽은 뒤 compact가 더 줄임).
+# 비율은 그래프 라벨에 그대로 표시되므로 float64로 둠 (float32면 57.85가 57.8%로 바뀜)
+DTYPES = {
+    "Country/Region": "category",
+    "WHO Region": "category",
+    "Confirmed": "int32",
+    "Deaths": "int32",
+    "Recovered": "int32",
+    "Active": "int32",
+    "New cases": "int32",
+    "New deaths": "int32",
+    "New recovered": "int32",
+    "Confirmed last week": "int32",
+    "1 week change": "int32",
+    "Deaths / 100 Cases": "float64",
+    "Recovered / 100 Cases": "float64",
+    "Deaths / 100 Recovered": "float64",
+    "1 week % increase": "float64",
+}
+
+# parquet 사이드카 형식 버전. 저장되는 dtype이 바뀌면 올려서 이전 사이드카를 쓰지 않게 함
+SIDECAR_VERSION = 2
+
+
+def _sidecar_path(csv_path):
+    return f"{os.path.splitext(csv_path)[0]}.v{SIDECAR_VERSION}.parquet"
+
+
+def _read_csv(csv_path):
+    header = pd.read_csv(csv_path, nrows=0).columns
+    df = pd.read_csv(
+        csv_path,
+        dtype={col: dtype for col, dtype in DTYPES.items() if col in header},
+        parse_dates=["Date"] if "Date" in header else False,
+    )
+    df = df.rename(columns=RENAME)
+    sort_cols = ["country", "date"] if "date" in df.columns else ["country"]
+    return df.sort_values(sort_cols).reset_index(drop=True)
+
+
+def load(filename, use_cache=True):
+    """
+    CSV를 표준 컬럼명/dtype으로 읽어서 국가명(일별 데이터는 국가, 날짜) 순으로 정렬한 데이터프레임.
+    같은 이름의 .parquet 사이드카(.v{SIDECAR_VERSION}.parquet)가 CSV보다 새로우면 그걸 읽고, 아니면 CSV를 읽은 뒤 사이드카를 다시 씀.
+    국가는 category, 건수는 가장 작은 정수 타입, 비율은 float64, 날짜(date)는 int32 일 오프셋
+    (날짜가 필요하면 dates(df))
+    """
+    csv_path = os.path.join(BASE_DIR, filename)
+    sidecar = _sidecar_path(csv_path)
+
+    if use_cache and os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(csv_path):
+        try:
+            # 압축 전에 만들어진 사이드카도 같은 타입이 되도록 한 번 더 적용 (이미 압축됐으면 그대로)
+            return compact.compact_frame(pd.read_parquet(sidecar), float_dtype=None)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"[kaggle_data] 캐시 읽기 실패, CSV 사용: {e}")
+
+    df = compact.compact_frame(_read_csv(csv_path), float_dtype=None)
+    if use_cache:
+        # report.py는 스크립트들을 프로세스 풀에서 동시에 돌리므로 임시 파일 이름에 pid를 넣음 (store.write_json과 같은 방식)
+        tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, sidecar)
+        except (ImportError, OSError) as e:
+            # pyarrow가 없거나 폴더에 쓸 수 없으면 캐시 없이 진행
+            print(f"[kaggle_data] 캐시 저장 생략: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return df
+
+
+def load_country_wise_latest(use_cache=True):
+    """국가별 최신 누적 데이터 (country_wise_latest.csv)"""
+    return load("country_wise_latest.csv", use_cache)
+
+
+def dates(df, col="date"):
+    """압축된 일 오프셋 열 → DatetimeIndex"""
+    return compact.dates(df, col)
+
+
+def country_index():
+    """
+    국가 이름 인덱스 (countries.CountryIndex, 프로세스당 한 번 생성).
+    "Korea, South", "South Korea", "KOR", "한국"이 모두 같은 국가 ID로 해석됨
+    """
+    return countries.load_index()
+
+
+def load_full_grouped(use_cache=True):
+    """국가별 일별 데이터 (full_grouped.csv, Kaggle에서 따로 내려받아 이 폴더에 둠)"""
+    return load("full_grouped.csv", use_cache)
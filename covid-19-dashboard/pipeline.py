@@ -0,0 +1,185 @@
+# pipeline.py 분석 단계를 의존성 그래프로 묶고, 단계별 결과를 내용 해시로 디스크에 캐시
+#
+# 단계의 캐시 키 = 단계 함수 소스 코드 + 단계가 쓰는 이 저장소 모듈(kaggle_data → compact → store ...)의 소스
+#                + 입력 단계 결과의 내용 해시.
+# 입력 CSV나 단계 코드, 도우미 모듈이 바뀐 단계(와 결과가 실제로 달라진 하위 단계)만 다시 실행됨
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+import types
+
+from plotly.basedatatypes import BaseFigure
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, ".pipeline_cache")
+# 이 폴더 아래에 있는 모듈만 캐시 키에 넣음 (pandas, plotly 같은 설치된 패키지는 제외)
+REPO_DIR = os.path.dirname(BASE_DIR)
+
+
+def _sha256(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _is_repo_module(module):
+    path = getattr(module, "__file__", None)
+    if not path:
+        return False
+    path = os.path.abspath(path)
+    return path.startswith(REPO_DIR + os.sep) and "site-packages" not in path
+
+
+def _global_names(code):
+    """함수 코드(안쪽 컴프리헨션/람다 포함)가 참조하는 이름"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def local_modules(func):
+    """
+    단계 함수가 쓰는 이 저장소의 모듈 {이름: 파일 경로}. 그 모듈이 import한 저장소 모듈까지 따라감
+    (standardized → kaggle_data → compact → store, synthetic)
+    """
+    found = {}
+    pending = [func.__globals__.get(name) for name in _global_names(func.__code__)]
+    while pending:
+        module = pending.pop()
+        if not isinstance(module, types.ModuleType) or module.__name__ in found or not _is_repo_module(module):
+            continue
+        found[module.__name__] = os.path.abspath(module.__file__)
+        pending.extend(vars(module).values())
+    return found
+
+
+class Pipeline:
+    """
+    사용 예)
+        p = Pipeline("weekly_pct")
+        p.source("csv", "country_wise_latest.csv")
+
+        @p.step("csv")
+        def standardized(csv_path): ...
+
+        outputs = p.run("fig_increase")
+    """
+
+    def __init__(self, name, cache_dir=CACHE_DIR, verbose=True):
+        self.name = name
+        self.cache_dir = os.path.join(cache_dir, name)
+        self.verbose = verbose
+        self._sources = {}
+        self._steps = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index_path = os.path.join(self.cache_dir, "index.json")
+        self._index = self._load_index()
+
+    def source(self, name, path):
+        """입력 파일 노드. 값은 파일 경로, 해시는 파일 내용"""
+        self._sources[name] = os.path.join(BASE_DIR, path)
+
+    def step(self, *deps):
+        """단계 등록 데코레이터. 함수 이름이 노드 이름, 인자는 deps 순서대로 들어감"""
+        def decorator(func):
+            self._steps[func.__name__] = (func, deps)
+            return func
+        return decorator
+
+    def _load_index(self):
+        """{노드 이름: {"key": 캐시 키, "output": 결과 해시}}"""
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self._index_path)
+
+    def _pickle_path(self, name, key):
+        return os.path.join(self.cache_dir, f"{name}-{key[:16]}.pkl")
+
+    def _log(self, message):
+        if self.verbose:
+            print(f"[pipeline] {message}")
+
+    def run(self, *targets):
+        """targets 노드 값을 반환 {이름: 값}. 필요한 노드만 실행하고, 최신 캐시가 있으면 필요할 때만 읽음"""
+        hashes = {}   # 노드 → 결과 내용 해시
+        values = {}   # 이번 실행에서 메모리에 올린 값
+        file_hashes = {}  # 모듈 파일 → 내용 해시 (여러 단계가 같은 모듈을 씀)
+        executed = []
+
+        def file_hash(path):
+            if path not in file_hashes:
+                with open(path, "rb") as f:
+                    file_hashes[path] = _sha256(f.read())
+            return file_hashes[path]
+
+        def code_key(func):
+            modules = sorted(local_modules(func).items())
+            return [inspect.getsource(func), *[f"{module}:{file_hash(path)}" for module, path in modules]]
+
+        def output_hash(name):
+            if name in hashes:
+                return hashes[name]
+            if name in self._sources:
+                with open(self._sources[name], "rb") as f:
+                    hashes[name] = _sha256(f.read())
+                return hashes[name]
+
+            func, deps = self._steps[name]
+            key = _sha256(name, *code_key(func), *[output_hash(dep) for dep in deps])
+            entry = self._index.get(name)
+            if entry and entry["key"] == key and os.path.exists(self._pickle_path(name, key)):
+                hashes[name] = entry["output"]
+                return hashes[name]
+
+            # 오래된 캐시 → 실행
+            started = time.perf_counter()
+            value = func(*[load(dep) for dep in deps])
+            if isinstance(value, BaseFigure):
+                # 그래프는 dict로 저장/반환. go.Figure로 다시 읽으면 모든 속성을 검증해서 캐시를 써도 느림
+                value = value.to_dict()
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if entry:
+                old_path = self._pickle_path(name, entry["key"])
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+            with open(self._pickle_path(name, key), "wb") as f:
+                f.write(data)
+            self._index[name] = {"key": key, "output": _sha256(data)}
+            values[name] = value
+            hashes[name] = self._index[name]["output"]
+            executed.append(name)
+            self._log(f"{name}: 실행 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+            return hashes[name]
+
+        def load(name):
+            if name in self._sources:
+                return self._sources[name]
+            if name not in values:
+                output_hash(name)
+            if name not in values:
+                with open(self._pickle_path(name, self._index[name]["key"]), "rb") as f:
+                    values[name] = pickle.load(f)
+            return values[name]
+
+        result = {target: load(target) for target in targets}
+        if executed:
+            self._save_index()
+        else:
+            self._log("모든 단계가 최신 (캐시 사용)")
+        return result
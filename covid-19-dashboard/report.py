@@ -0,0 +1,140 @@
+# report.py 대시보드 스크립트의 그래프를 브라우저 대신 한 파일 리포트로 모으는 헤드리스 내보내기
+#
+#   python report.py                      # report.html 하나 (plotly.js는 한 번만 포함)
+#   python report.py --images png svg     # report_images/ 에 PNG/SVG도 저장 (kaleido 필요)
+
+import argparse
+import contextlib
+import glob
+import html
+import io
+import os
+import re
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATTERN = "Covid19_kds_Kaggle_*.py"
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, "report.html")
+DEFAULT_IMAGE_DIR = os.path.join(BASE_DIR, "report_images")
+
+# 수집 모드일 때 show()가 그래프를 쌓는 목록 (None이면 평소처럼 브라우저에 표시)
+_collected = None
+
+
+def show(fig):
+    """
+    스크립트에서 fig.show(renderer="browser") 대신 호출. 리포트 생성 중이면 그래프만 모음.
+    fig는 go.Figure 또는 pipeline 캐시가 돌려주는 그래프 dict
+    """
+    if _collected is None:
+        pio.show(fig, renderer="browser")
+    else:
+        _collected.append(fig)
+
+
+def _figure_title(fig, default):
+    layout = fig.get("layout", {}) if isinstance(fig, dict) else fig.to_plotly_json()["layout"]
+    title = layout.get("title") or {}
+    text = (title.get("text") if isinstance(title, dict) else title) or default
+    # <br><sub>부제목</sub> 같은 태그는 목차에서 뺌
+    return re.sub(r"<[^>]+>", " ", text.split("<br>")[0]).strip()
+
+
+def _slug(text):
+    return re.sub(r"[^0-9A-Za-z]+", "-", text).strip("-").lower()
+
+
+def render_script(path, image_formats=(), image_dir=DEFAULT_IMAGE_DIR):
+    """
+    스크립트 하나를 실행해서 그래프를 모으고 <div> 조각으로 렌더링 (작업 프로세스에서 실행).
+    반환: [(제목, html 조각)]
+    """
+    # python report.py로 실행하면 이 파일은 __main__이고, 스크립트의 import report는 별도 모듈을 가져옴.
+    # 스크립트가 보는 모듈에 수집 목록을 달아야 하므로 report 모듈을 직접 가져와서 씀
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    import report
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    report._collected = []
+    try:
+        # 스크립트의 print 출력은 리포트에 필요 없으므로 버림
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(path, run_name="__main__")
+        figures = report._collected
+    finally:
+        report._collected = None
+
+    sections = []
+    for i, fig in enumerate(figures, start=1):
+        div_id = f"{_slug(name)}-{i}"
+        title = _figure_title(fig, f"{name} #{i}")
+        sections.append((title, pio.to_html(fig, include_plotlyjs=False, full_html=False, div_id=div_id,
+                                            validate=False)))
+        for fmt in image_formats:
+            pio.write_image(fig, os.path.join(image_dir, f"{div_id}.{fmt}"), validate=False)
+    return name, sections
+
+
+def build_report(results, elapsed):
+    """스크립트별 그래프 조각을 plotly.js 하나만 포함한 HTML 문서로 합침"""
+    toc, body = [], []
+    for name, sections in results:
+        body.append(f"<h2>{html.escape(name)}</h2>")
+        for title, fragment in sections:
+            anchor = re.search(r'id="([^"]+)"', fragment).group(1)
+            toc.append(f'<li><a href="#{anchor}">{html.escape(name)} - {html.escape(title)}</a></li>')
+            body.append(f"<section><h3>{html.escape(title)}</h3>{fragment}</section>")
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<title>COVID-19 Kaggle 분석 리포트</title>
+<script type="text/javascript">{get_plotlyjs()}</script>
+<style>body {{ font-family: sans-serif; margin: 24px; }} section {{ margin-bottom: 48px; }}</style>
+</head>
+<body>
+<h1>COVID-19 Kaggle 분석 리포트</h1>
+<p>그래프 {sum(len(s) for _, s in results)}개 · 생성 {time.strftime('%Y-%m-%d %H:%M:%S')} · {elapsed:.1f}초</p>
+<ol>{''.join(toc)}</ol>
+{''.join(body)}
+</body>
+</html>
+"""
+
+
+def export(output=DEFAULT_OUTPUT, image_formats=(), image_dir=DEFAULT_IMAGE_DIR, max_workers=None):
+    """모든 대시보드 스크립트를 프로세스 풀에서 동시에 실행해서 리포트 파일 하나로 저장"""
+    started = time.perf_counter()
+    scripts = sorted(glob.glob(os.path.join(BASE_DIR, SCRIPT_PATTERN)))
+    if image_formats:
+        os.makedirs(image_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(render_script, path, tuple(image_formats), image_dir) for path in scripts]
+        results = [future.result() for future in futures]
+
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(build_report(results, time.perf_counter() - started))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 그래프를 HTML 리포트 하나로 내보내기")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--images", nargs="*", default=[], choices=["png", "svg"],
+                        help="그래프별 정적 이미지도 저장 (kaleido 필요)")
+    parser.add_argument("--image-dir", default=DEFAULT_IMAGE_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    results = export(args.output, args.images, args.image_dir, args.workers)
+    total = sum(len(sections) for _, sections in results)
+    print(f"스크립트 {len(results)}개, 그래프 {total}개 -> {args.output}")
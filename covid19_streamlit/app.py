@@ -1,10 +1,26 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-import plotly.graph_objects as go
-from datetime import datetime
-import json
-import time
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import artifact
+import charts
+import circuit
+import compact
+import fetcher
+import ingest
+import monthly
+import figure_cache
+import payload
+import perf
+import refresher
+import render_cache
+import series
+import serialization
+import store
+import synthetic
 
 # 페이지 설정
 st.set_page_config(
@@ -57,10 +73,129 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# 데이터 로드
+# 주요 국가별 누적 확진 차트의 국가와 배율
+COUNTRIES_CONFIG = charts.COUNTRIES_CONFIG
+
+def _load_covid_data_local():
+    """
+    메모리 맵 아티팩트(data/store/datasets.mmap), 없으면 로컬 데이터셋 저장소, 그것도 없으면 기본 데이터.
+    네트워크는 사용하지 않음
+    """
+    # 모든 워커가 같은 파일을 읽기 전용으로 매핑해서 데이터 메모리를 공유
+    mapped = artifact.open_artifact()
+    if mapped is not None and mapped.is_current():
+        return mapped.data(), 'artifact'
+
+    timeline = store.read_dataset('timeline')
+    cities = store.read_dataset('cities')
+    if timeline is not None and cities is not None:
+        return {
+            'timeline': compact.compact_frame(timeline),
+            'cities': cities.to_dict('records'),
+            'revisions': store.dataset_revisions('timeline')
+        }, 'store'
+
+    # 기본 데이터 (시드 고정이라 모든 워커 프로세스가 같은 데이터를 만듦)
+    timeline = synthetic.generate_timeline()
+    return {'timeline': compact.compact_frame(timeline), 'cities': list(synthetic.DEFAULT_CITIES)}, 'fallback'
+
+def _load_covid_data_remote():
+    """원격 CSV 동시 다운로드 후 저장소에 기록 (백그라운드 갱신 스레드에서만 호출)"""
+    results, errors = fetcher.fetch_all(fetcher.github_sources())
+    if errors:
+        raise next(iter(errors.values()))
+    
+    timeline = store.coerce(pd.read_csv(io.BytesIO(results['timeline'])), 'timeline')
+    cities = store.coerce(pd.read_csv(io.BytesIO(results['cities'])), 'cities')
+    if timeline.empty:
+        # 갱신 실패로 처리해서 이전 스냅샷을 유지 (빈 타임라인으로 저장소/아티팩트를 바꾸지 않음)
+        raise ingest.IngestError("timeline 응답이 비어 있음")
+    
+    try:
+        # 타임라인은 마지막으로 저장한 날 이후의 행만 추가 (과거 값이 바뀌었으면 전체를 새로 씀)
+        try:
+            ingest.ingest_frame('timeline', timeline)
+        except ingest.IngestError as e:
+            print(f"[ingest] timeline: {e}, 전체 다시 저장")
+            ingest.replace('timeline', timeline)
+        store.write_dataset('cities', cities)
+        # 새 데이터로 아티팩트를 다시 빌드해서 매핑 (다른 워커도 다음 로드부터 같은 파일을 공유)
+        artifact.build(timeline, cities, COUNTRIES_CONFIG)
+        mapped = artifact.open_artifact()
+        if mapped is not None:
+            return mapped.data()
+    except OSError as e:
+        print(f"[store] 저장 실패: {e}")
+    
+    # 저장소에 반영되지 않았을 수 있는 새 데이터이므로 저장소 변경 이력은 붙이지 않음
+    # (차트 캐시 키가 이전 저장소 버전이 아니라 스냅샷 버전이 되도록)
+    return {
+        'timeline': compact.compact_frame(timeline),
+        'cities': cities.to_dict('records') if not cities.empty else [],
+        'revisions': []
+    }
+
+def load_covid_snapshot():
+    """
+    마지막으로 성공한 데이터 스냅샷(version, data, ...)을 바로 반환.
+    원격 갱신은 백그라운드 스레드가 주기적으로 하므로 사용자 요청은 네트워크를 기다리지 않음
+    (모든 세션이 같은 스냅샷을 공유하므로 반환된 데이터프레임을 수정하면 안 됨)
+    """
+    return refresher.get_refresher('covid', _load_covid_data_local, _load_covid_data_remote).snapshot()
+
+def load_covid_data():
+    return load_covid_snapshot().data
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def get_country_series(data_version, countries_items, _data):
+    """
+    국가별 누적 확진 행렬. 아티팩트에 같은 국가 구성의 행렬이 있으면 그 뷰를 그대로 쓰고,
+    없으면 데이터 버전이 바뀔 때만 다시 계산
+    """
+    prepared = _data.get('countries')
+    if prepared is not None and prepared.names == [name for name, _ in countries_items]:
+        return prepared
+    timeline = _data['timeline']
+    return series.from_multipliers(compact.dates(timeline), timeline['cases'].to_numpy(), dict(countries_items))
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_monthly(source_mtime):
+    """월간 국가 × 월 행렬 (보기별 CountrySeries). CSV가 바뀔 때만 다시 읽음"""
+    return monthly.load_monthly()
+
+@st.cache_resource
+def start_warmup():
+    """
+    데이터 스냅샷 로드, 국가 행렬 계산, 기본 보기 차트 생성을 백그라운드 스레드에서 시작 (프로세스당 한 번).
+    로딩 화면은 반환된 Future가 끝나기를 기다림
+    """
+    def warm_up():
+        snapshot = load_covid_snapshot()
+        country_series = get_country_series(snapshot.version, tuple(COUNTRIES_CONFIG.items()), snapshot.data)
+        # 첫 화면 기본 보기의 차트까지 캐시에 만들어 둠 (섹션이 같은 키로 찾으므로 첫 렌더링은 캐시 적중)
+        monthly_mtime = monthly.source_mtime()
+        charts.warm_up(snapshot.data, snapshot.version, country_series, get_monthly(monthly_mtime), monthly_mtime)
+        return snapshot.version
+
+    # st.cache_resource 함수를 호출하므로 현재 스크립트 컨텍스트를 작업 스레드에 붙여 줌.
+    # 로딩 화면의 스크립트 실행은 먼저 끝나므로, 이 스레드에서 부르는 캐시 함수는 스피너(메시지 전송)를 끔
+    executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix='warmup',
+        initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx()))
+    future = executor.submit(warm_up)
+    executor.shutdown(wait=False)
+    return future
+
 # 로딩 화면 (원본과 동일한 Facts 포함)
 if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
 
+# 프로세스에서 처음 접속한 세션이 데이터 로딩을 시작하고, 끝나면 로딩 화면 없이 바로 표시
+warmup = start_warmup()
+if not st.session_state.data_loaded and warmup.done():
+    st.session_state.data_loaded = True
+
 if not st.session_state.data_loaded:
     loading_html = """
     <!DOCTYPE html>
@@ -75,7 +210,7 @@ if not st.session_state.data_loaded:
     h2{color:#60a5fa;margin:30px 0 20px;font-size:2rem}
     .fact{color:#94a3b8;font-size:1.1rem;margin:20px 40px;text-align:center;min-height:60px;max-width:600px;line-height:1.6}
     .progress-container{width:400px;height:6px;background:#1e293b;border-radius:3px;margin-top:30px;overflow:hidden;position:relative}
-    .progress-bar{height:100%;background:linear-gradient(90deg,#667eea,#764ba2);width:0%;animation:loading 3s ease-in-out forwards}
+    .progress-bar{height:100%;background:linear-gradient(90deg,#667eea,#764ba2);width:0%;animation:loading 1.5s ease-in-out infinite}
     @keyframes loading{0%{width:0%}100%{width:100%}}
     </style>
     </head>
@@ -107,73 +242,39 @@ if not st.session_state.data_loaded:
     </html>
     """
     components.html(loading_html, height=700)
-    time.sleep(3)
-    st.session_state.data_loaded = True
-    st.rerun()
 
-# 데이터 로드
-@st.cache_data
-def load_covid_data():
-    base_url = "https://raw.githubusercontent.com/hyoeun979704-web/Covid-19_Project_bive-coding-team/main/COVID19/data/"
-    
-    try:
-        timeline = pd.read_csv(base_url + "timeline.csv")
-        cities = pd.read_csv(base_url + "cities.csv")
-        
-        if 'date' in timeline.columns:
-            timeline['date'] = pd.to_datetime(timeline['date'])
-        
-        return {
-            'timeline': timeline,
-            'cities': cities.to_dict('records') if not cities.empty else []
-        }
-    except:
-        # 기본 데이터
-        from datetime import timedelta
-        import numpy as np
-        
-        start_date = datetime(2020, 1, 1)
-        dates = [start_date + timedelta(days=i) for i in range(2195)]
-        
-        cases = []
-        deaths = []
-        current = 0
-        
-        for i in range(2195):
-            if i < 60:
-                daily = np.random.exponential(500)
-            elif i < 365:
-                daily = np.random.exponential(50000)
-            elif i < 730:
-                daily = np.random.exponential(100000)
-            else:
-                daily = np.random.exponential(200000)
-            
-            current += daily
-            cases.append(int(current))
-            deaths.append(int(current * 0.009))
-        
-        timeline = pd.DataFrame({'date': dates, 'cases': cases, 'deaths': deaths})
-        
-        cities = [
-            {'name': 'Wuhan', 'lat': 30.5928, 'lon': 114.3055, 'cases': 50000},
-            {'name': 'Seoul', 'lat': 37.5665, 'lon': 126.9780, 'cases': 150000},
-            {'name': 'New York', 'lat': 40.7128, 'lon': -74.0060, 'cases': 1000000},
-            {'name': 'London', 'lat': 51.5074, 'lon': -0.1278, 'cases': 500000},
-            {'name': 'Tokyo', 'lat': 35.6762, 'lon': 139.6503, 'cases': 300000},
-            {'name': 'Paris', 'lat': 48.8566, 'lon': 2.3522, 'cases': 400000},
-            {'name': 'Sao Paulo', 'lat': -23.5505, 'lon': -46.6333, 'cases': 600000},
-            {'name': 'Mumbai', 'lat': 19.0760, 'lon': 72.8777, 'cases': 450000},
-            {'name': 'Sydney', 'lat': -33.8688, 'lon': 151.2093, 'cases': 200000},
-            {'name': 'Moscow', 'lat': 55.7558, 'lon': 37.6173, 'cases': 350000}
-        ]
-        
-        return {'timeline': timeline, 'cities': cities}
+    # 데이터가 준비됐는지 짧은 주기로 확인. 기다리는 동안 스크립트 스레드는 반환됨
+    @st.fragment(run_every=0.3)
+    def wait_for_data():
+        if warmup.done():
+            st.session_state.data_loaded = True
+            st.rerun()
 
-data = load_covid_data()
+    wait_for_data()
+    st.stop()
+
+snapshot = load_covid_snapshot()
+data_version = snapshot.version
+data = snapshot.data
 df = data['timeline']
 cities = data['cities']
 
+# 데이터 소스 상태 (사이드바, 기본은 접혀 있음)
+with st.sidebar:
+    st.markdown("### 🛰️ 데이터 상태")
+    for name, status in refresher.refresher_states().items():
+        st.caption(f"{name}: v{status['version']} · {status['source']} · {int(status['age'])}초 전 갱신")
+    for name, state in circuit.breaker_states().items():
+        st.caption(f"{name}: {state['state']} (연속 실패 {state['failures']}회)")
+    render_stats = render_cache.cache.stats()
+    st.caption(f"HTML 캐시: 적중 {render_stats['hits']} / 미스 {render_stats['misses']} ({render_stats['entries']}개)")
+    figure_stats = figure_cache.cache.stats()
+    st.caption(f"차트 캐시: 적중 {figure_stats['hits']} / 미스 {figure_stats['misses']} ({figure_stats['bytes'] / 1024:,.0f} KB)")
+    # 섹션별 재실행 시간 (p95 / 예산)
+    for name, section in perf.stats().items():
+        mark = "⚠️" if section['over_budget'] else "✅"
+        st.caption(f"{mark} {name}: p95 {section['p95_ms']}ms / 예산 {section['budget_ms']}ms")
+
 # 히어로 섹션
 st.markdown("""
 <div class="hero-section">
@@ -181,39 +282,17 @@ st.markdown("""
     <p class="hero-subtitle">2019년 말부터 현재까지, 인류 역사를 바꾼 결정적 순간들</p>
 </div>
 """, unsafe_allow_html=True)
-# 지구본 섹션
-st.markdown('<h2 class="section-title">🌍 전 세계 팬데믹 확산 현황</h2>', unsafe_allow_html=True)
-st.markdown('<p class="section-subtitle">실시간 지구본 시각화로 코로나19의 전 세계 확산 과정을 추적합니다</p>', unsafe_allow_html=True)
-
-# 통계 카드 (원본과 동일하게 5개)
-col1, col2, col3, col4, col5 = st.columns(5)
-last_row = df.iloc[-1]
-
-# 신규 확진자 계산
-if len(df) > 1:
-    new_cases = int(df.iloc[-1]['cases'] - df.iloc[-2]['cases'])
-else:
-    new_cases = 0
-
-with col1:
-    st.metric("📅 현재 날짜", "2023-12-31")
-with col2:
-    st.metric("📊 경과 일수", "2,195")
-with col3:
-    st.metric("🦠 누적 확진자", f"{int(last_row['cases']):,}")
-with col4:
-    st.metric("📈 신규 확진자", f"{new_cases:,}")
-with col5:
-    st.metric("🌐 발생 도시", len(cities))
 
-st.write("")
+# 3D 지구본 HTML (원본 index.html에서 그대로 가져옴)
+# 템플릿을 고치면 버전을 올려야 캐시된 HTML이 교체됨
+GLOBE_TEMPLATE_VERSION = 1
 
-# 데이터를 JSON으로 변환
-timeline_json = df.to_json(orient='records', date_format='iso')
-cities_json = json.dumps(cities)
+def build_globe_html(df, cities):
+    # 데이터를 JSON으로 변환 (타임라인은 base64 typed array로 압축)
+    timeline_payload = payload.encode_timeline(df)
+    cities_json = serialization.dumps(cities)
 
-# 3D 지구본 HTML (원본 index.html에서 그대로 가져옴)
-globe_html = f"""
+    return f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -289,7 +368,8 @@ canvas{{display:block}}
 </div>
 <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
 <script>
-const timelineData={timeline_json};
+{payload.DECODER_JS}
+const timelineData=decodeTimeline({timeline_payload});
 const citiesData={cities_json};
 let scene,camera,renderer,globe,cityMarkers=[],isPlaying=false,currentDay=0,speed=1,animationInterval,isDragging=false,previousNewCases=0;
 
@@ -395,20 +475,19 @@ updateTimeline(currentDay);
 function updateTimeline(day){{
 currentDay=parseInt(day);
 if(currentDay>=timelineData.length)currentDay=timelineData.length-1;
-const data=timelineData[currentDay];
-const date=new Date(data.date).toISOString().split('T')[0];
+const date=timelineData.date(currentDay);
+const cases=timelineData.cases[currentDay];
 
 // 신규 확진자 계산
 let newCases=0;
 if(currentDay>0){{
-const prevData=timelineData[currentDay-1];
-newCases=data.cases-prevData.cases;
+newCases=cases-timelineData.cases[currentDay-1];
 }}
 
 document.getElementById('current-date').textContent=date;
 document.getElementById('info-date').textContent=date;
 document.getElementById('info-day').textContent=currentDay;
-document.getElementById('info-cases').textContent=data.cases.toLocaleString();
+document.getElementById('info-cases').textContent=cases.toLocaleString();
 document.getElementById('info-new-cases').textContent=newCases.toLocaleString();
 }}
 
@@ -430,373 +509,160 @@ init();
 </html>
 """
 
-components.html(globe_html, height=720)
+@st.fragment
+@perf.timed('globe')
+def globe_section():
+    # 지구본 섹션
+    st.markdown('<h2 class="section-title">🌍 전 세계 팬데믹 확산 현황</h2>', unsafe_allow_html=True)
+    st.markdown('<p class="section-subtitle">실시간 지구본 시각화로 코로나19의 전 세계 확산 과정을 추적합니다</p>', unsafe_allow_html=True)
+
+    # 통계 카드 (원본과 동일하게 5개)
+    col1, col2, col3, col4, col5 = st.columns(5)
+    last_row = df.iloc[-1]
+
+    # 신규 확진자 계산
+    if len(df) > 1:
+        new_cases = int(df.iloc[-1]['cases'] - df.iloc[-2]['cases'])
+    else:
+        new_cases = 0
+
+    with col1:
+        st.metric("📅 현재 날짜", "2023-12-31")
+    with col2:
+        st.metric("📊 경과 일수", "2,195")
+    with col3:
+        st.metric("🦠 누적 확진자", f"{int(last_row['cases']):,}")
+    with col4:
+        st.metric("📈 신규 확진자", f"{new_cases:,}")
+    with col5:
+        st.metric("🌐 발생 도시", len(cities))
+
+    st.write("")
+
+    # 데이터 버전이 같으면 이전에 만든 HTML을 재사용 (변이 버튼 클릭 등 다른 상호작용 시)
+    globe_html = render_cache.cache.render(
+        'globe', GLOBE_TEMPLATE_VERSION, data_version, (), lambda: build_globe_html(df, cities))
+    components.html(globe_html, height=720)
+
+globe_section()
 
 st.write("---")
-# 데이터 분석 차트
-st.markdown('<h2 class="section-title">📊 데이터 분석 및 통계</h2>', unsafe_allow_html=True)
-st.markdown('<p class="section-subtitle">전 세계 확진자 및 사망자 추이를 시계열 데이터로 분석합니다</p>', unsafe_allow_html=True)
-
-# 확진자 & 사망자 추이
-col1, col2 = st.columns(2)
-
-with col1:
-    fig_cases = go.Figure()
-    fig_cases.add_trace(go.Scatter(
-        x=df['date'], 
-        y=df['cases'],
-        fill='tozeroy',
-        fillcolor='rgba(96, 165, 250, 0.2)',
-        line=dict(color='#60a5fa', width=2),
-        name='누적 확진자'
-    ))
-    fig_cases.update_layout(
-        title='📉 전 세계 확진자 추이',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        xaxis=dict(gridcolor='#334155', showgrid=True),
-        yaxis=dict(gridcolor='#334155', showgrid=True),
-        height=400,
-        margin=dict(l=20, r=20, t=60, b=20),
-        showlegend=False
-    )
-    st.plotly_chart(fig_cases, use_container_width=True)
-
-with col2:
-    fig_deaths = go.Figure()
-    fig_deaths.add_trace(go.Scatter(
-        x=df['date'], 
-        y=df['deaths'],
-        fill='tozeroy',
-        fillcolor='rgba(248, 113, 113, 0.2)',
-        line=dict(color='#f87171', width=2),
-        name='누적 사망자'
-    ))
-    fig_deaths.update_layout(
-        title='💔 전 세계 사망자 추이',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        xaxis=dict(gridcolor='#334155', showgrid=True),
-        yaxis=dict(gridcolor='#334155', showgrid=True),
-        height=400,
-        margin=dict(l=20, r=20, t=60, b=20),
-        showlegend=False
-    )
-    st.plotly_chart(fig_deaths, use_container_width=True)
 
-st.write("")
+@st.fragment
+@perf.timed('analytics')
+def analytics_section():
+    # 데이터 분석 차트
+    st.markdown('<h2 class="section-title">📊 데이터 분석 및 통계</h2>', unsafe_allow_html=True)
+    st.markdown('<p class="section-subtitle">전 세계 확진자 및 사망자 추이를 시계열 데이터로 분석합니다</p>', unsafe_allow_html=True)
+
+    # 차트에는 기간마다 LTTB로 줄인 점만 보내고, 기간을 좁히면 원본 데이터에서 다시 샘플링
+    # 타임라인의 날짜는 int32 일 오프셋으로 압축돼 있으므로 한 번 날짜로 펼쳐서 씀
+    timeline_dates = compact.dates(df)
+    first_date, last_date = timeline_dates[0].date(), timeline_dates[-1].date()
+    start, end = st.slider(
+        "📅 조회 기간", min_value=first_date, max_value=last_date,
+        value=(first_date, last_date), format="YYYY-MM-DD", key='analytics_range')
+    range_version = charts.range_version(data, data_version, start, end)
+
+    # 확진자 & 사망자 추이
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig_cases = charts.cases(df, timeline_dates, range_version, start, end)
+        st.plotly_chart(fig_cases, use_container_width=True)
+
+    with col2:
+        fig_deaths = charts.deaths(df, timeline_dates, range_version, start, end)
+        st.plotly_chart(fig_deaths, use_container_width=True)
 
-# 주요 국가별 누적 확진
-st.markdown('<h3 class="section-title" style="font-size:1.8rem">주요 국가별 누적 확진 및 변곡점</h3>', unsafe_allow_html=True)
-
-countries_data = []
-countries_config = {
-    '미국': 1.0,
-    '인도': 0.8,
-    '브라질': 0.6,
-    '프랑스': 0.4,
-    '독일': 0.35,
-    '영국': 0.38,
-    '한국': 0.15
-}
+    st.write("")
+
+    # 주요 국가별 누적 확진
+    st.markdown('<h3 class="section-title" style="font-size:1.8rem">주요 국가별 누적 확진 및 변곡점</h3>', unsafe_allow_html=True)
 
-for country, multiplier in countries_config.items():
-    for _, row in df.iterrows():
-        countries_data.append({
-            'date': row['date'],
-            'country': country,
-            'cases': int(row['cases'] * multiplier)
-        })
-
-df_countries = pd.DataFrame(countries_data)
-
-fig_countries = go.Figure()
-colors = ['#60a5fa', '#f87171', '#34d399', '#fbbf24', '#a78bfa', '#f472b6', '#fb923c']
-
-for idx, (country, color) in enumerate(zip(countries_config.keys(), colors)):
-    country_data = df_countries[df_countries['country'] == country]
-    fig_countries.add_trace(go.Scatter(
-        x=country_data['date'],
-        y=country_data['cases'],
-        mode='lines',
-        name=country,
-        line=dict(color=color, width=2)
-    ))
-
-fig_countries.update_layout(
-    title='',
-    plot_bgcolor='#1e293b',
-    paper_bgcolor='#1e293b',
-    font=dict(color='#cbd5e1', family='Noto Sans KR'),
-    xaxis=dict(gridcolor='#334155', title='날짜'),
-    yaxis=dict(gridcolor='#334155', title='누적 확진자'),
-    height=500,
-    legend=dict(
-        orientation='h',
-        yanchor='bottom',
-        y=1.02,
-        xanchor='right',
-        x=1
-    ),
-    hovermode='x unified'
-)
-st.plotly_chart(fig_countries, use_container_width=True)
+
+    country_series = get_country_series(data_version, tuple(COUNTRIES_CONFIG.items()), data)
+    fig_countries = charts.country_lines(country_series, range_version, start, end)
+    st.plotly_chart(fig_countries, use_container_width=True)
+
+analytics_section()
 
 st.write("---")
 
-# 변이별 증상 비교
-st.markdown('<h2 class="section-title">🧬 변이별 증상 비교 분석</h2>', unsafe_allow_html=True)
-st.markdown('<p class="section-subtitle">델타와 오미크론 변이의 증상 발현율 비교 및 분석</p>', unsafe_allow_html=True)
+@st.fragment
+@perf.timed('symptoms')
+def symptoms_section():
+    # 변이별 증상 비교
+    st.markdown('<h2 class="section-title">🧬 변이별 증상 비교 분석</h2>', unsafe_allow_html=True)
+    st.markdown('<p class="section-subtitle">델타와 오미크론 변이의 증상 발현율 비교 및 분석</p>', unsafe_allow_html=True)
 
-symptoms_data = {
-    '증상': ['발열', '기침', '인후통', '두통', '근육통', '후각상실', '미각상실'],
-    '델타': [78, 82, 65, 71, 69, 42, 38],
-    '오미크론': [54, 70, 88, 84, 76, 18, 15]
-}
-df_symptoms = pd.DataFrame(symptoms_data)
+    col1, col2 = st.columns(2)
 
-col1, col2 = st.columns(2)
+    with col1:
+        fig_radar = charts.symptoms_radar()
+        st.plotly_chart(fig_radar, use_container_width=True)
 
-with col1:
-    fig_radar = go.Figure()
-    
-    fig_radar.add_trace(go.Scatterpolar(
-        r=df_symptoms['델타'],
-        theta=df_symptoms['증상'],
-        fill='toself',
-        fillcolor='rgba(239, 68, 68, 0.2)',
-        line=dict(color='#ef4444', width=2),
-        name='Delta (델타)'
-    ))
-    
-    fig_radar.add_trace(go.Scatterpolar(
-        r=df_symptoms['오미크론'],
-        theta=df_symptoms['증상'],
-        fill='toself',
-        fillcolor='rgba(96, 165, 250, 0.2)',
-        line=dict(color='#60a5fa', width=2),
-        name='Omicron (오미크론)'
-    ))
-    
-    fig_radar.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                gridcolor='#334155',
-                color='#cbd5e1'
-            ),
-            angularaxis=dict(
-                gridcolor='#334155',
-                color='#cbd5e1'
-            ),
-            bgcolor='#1e293b'
-        ),
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        title='🎯 증상 레이더 차트',
-        height=450,
-        showlegend=True,
-        legend=dict(
-            orientation='h',
-            yanchor='bottom',
-            y=-0.2,
-            xanchor='center',
-            x=0.5
-        )
-    )
-    st.plotly_chart(fig_radar, use_container_width=True)
-
-with col2:
-    fig_bar = go.Figure()
-    
-    fig_bar.add_trace(go.Bar(
-        x=df_symptoms['증상'],
-        y=df_symptoms['델타'],
-        name='Delta (델타)',
-        marker_color='#ef4444'
-    ))
-    
-    fig_bar.add_trace(go.Bar(
-        x=df_symptoms['증상'],
-        y=df_symptoms['오미크론'],
-        name='Omicron (오미크론)',
-        marker_color='#60a5fa'
-    ))
-    
-    fig_bar.update_layout(
-        barmode='group',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        title='📊 증상 막대 차트',
-        xaxis=dict(gridcolor='#334155', title='증상'),
-        yaxis=dict(gridcolor='#334155', title='발현율 (%)', range=[0, 100]),
-        height=450,
-        legend=dict(
-            orientation='h',
-            yanchor='bottom',
-            y=-0.3,
-            xanchor='center',
-            x=0.5
-        )
-    )
-    st.plotly_chart(fig_bar, use_container_width=True)
+    with col2:
+        fig_bar = charts.symptoms_bar()
+        st.plotly_chart(fig_bar, use_container_width=True)
+
+symptoms_section()
 
 st.write("---")
 
-# 백신 및 진단
-st.markdown('<h2 class="section-title">💉 백신 및 진단 검사</h2>', unsafe_allow_html=True)
-st.markdown('<p class="section-subtitle">백신 효능 및 진단 정확도 데이터 시각화</p>', unsafe_allow_html=True)
+@st.fragment
+@perf.timed('vaccine')
+def vaccine_section():
+    # 백신 및 진단
+    st.markdown('<h2 class="section-title">💉 백신 및 진단 검사</h2>', unsafe_allow_html=True)
+    st.markdown('<p class="section-subtitle">백신 효능 및 진단 정확도 데이터 시각화</p>', unsafe_allow_html=True)
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    vaccine_data = {
-        'vaccine': ['Pfizer-BioNTech', 'Moderna', 'AstraZeneca', 'Johnson & Johnson', 'Sinovac'],
-        'efficacy': [95, 94, 70, 66, 51]
-    }
-    df_vaccine = pd.DataFrame(vaccine_data)
-    
-    fig_vaccine = go.Figure(go.Bar(
-        x=df_vaccine['efficacy'],
-        y=df_vaccine['vaccine'],
-        orientation='h',
-        marker=dict(
-            color=df_vaccine['efficacy'],
-            colorscale=[[0, '#ef4444'], [0.5, '#fbbf24'], [1, '#34d399']],
-            showscale=False
-        ),
-        text=df_vaccine['efficacy'].apply(lambda x: f'{x}%'),
-        textposition='inside',
-        textfont=dict(size=14, color='white', family='Noto Sans KR')
-    ))
-    
-    fig_vaccine.update_layout(
-        title='💉 백신 예방 효능',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        xaxis=dict(gridcolor='#334155', title='효능 (%)', range=[0, 100]),
-        yaxis=dict(gridcolor='#334155', title=''),
-        height=400,
-        showlegend=False
-    )
-    st.plotly_chart(fig_vaccine, use_container_width=True)
-
-with col2:
-    diagnosis_data = {
-        'test': ['PCR', '신속항원검사', '항체검사'],
-        'accuracy': [99, 85, 80]
-    }
-    df_diagnosis = pd.DataFrame(diagnosis_data)
-    
-    fig_diagnosis = go.Figure(go.Bar(
-        x=df_diagnosis['test'],
-        y=df_diagnosis['accuracy'],
-        marker=dict(color=['#60a5fa', '#34d399', '#fbbf24']),
-        text=df_diagnosis['accuracy'].apply(lambda x: f'{x}%'),
-        textposition='outside',
-        textfont=dict(size=14, family='Noto Sans KR')
-    ))
-    
-    fig_diagnosis.update_layout(
-        title='🔬 진단 검사 정확도',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        xaxis=dict(gridcolor='#334155', title='검사 방법'),
-        yaxis=dict(gridcolor='#334155', title='정확도 (%)', range=[0, 110]),
-        height=400,
-        showlegend=False
-    )
-    st.plotly_chart(fig_diagnosis, use_container_width=True)
+    with col1:
+        fig_vaccine = charts.vaccine()
+        st.plotly_chart(fig_vaccine, use_container_width=True)
+
+    with col2:
+        fig_diagnosis = charts.diagnosis()
+        st.plotly_chart(fig_diagnosis, use_container_width=True)
+
+vaccine_section()
 
 st.write("---")
 
-# 심층 분석
-st.markdown('<h2 class="section-title">🧬 심층 분석 (In-depth Analysis)</h2>', unsafe_allow_html=True)
-st.markdown('<p class="section-subtitle">주요 국가별 팬데믹 확산 추이 분석 및 향후 추가 데이터 시각화</p>', unsafe_allow_html=True)
+@st.fragment
+@perf.timed('indepth')
+def indepth_section():
+    # 심층 분석
+    st.markdown('<h2 class="section-title">🧬 심층 분석 (In-depth Analysis)</h2>', unsafe_allow_html=True)
+    st.markdown('<p class="section-subtitle">주요 국가별 팬데믹 확산 추이 분석 및 향후 추가 데이터 시각화</p>', unsafe_allow_html=True)
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    variants_timeline = {
-        'variant': ['Original', 'Alpha', 'Beta', 'Gamma', 'Delta', 'Omicron'],
-        'duration': [240, 120, 180, 150, 270, 700],
-        'color': ['#64748b', '#ef4444', '#f97316', '#fbbf24', '#dc2626', '#60a5fa']
-    }
-    df_variants = pd.DataFrame(variants_timeline)
-    
-    fig_variants = go.Figure(go.Bar(
-        x=df_variants['duration'],
-        y=df_variants['variant'],
-        orientation='h',
-        marker=dict(color=df_variants['color']),
-        text=df_variants['duration'].apply(lambda x: f'{x}일'),
-        textposition='inside',
-        textfont=dict(size=14, color='white', family='Noto Sans KR')
-    ))
-    
-    fig_variants.update_layout(
-        title='⏳ 변이별 우세 지속 기간',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        xaxis=dict(gridcolor='#334155', title='지속 일수'),
-        yaxis=dict(gridcolor='#334155', title=''),
-        height=400,
-        showlegend=False
-    )
-    st.plotly_chart(fig_variants, use_container_width=True)
-
-with col2:
-    cfr_data = {
-        'variant': ['Original', 'Alpha', 'Beta', 'Gamma', 'Delta', 'Omicron'],
-        'cfr': [2.1, 1.8, 1.5, 1.3, 0.95, 0.1]
-    }
-    df_cfr = pd.DataFrame(cfr_data)
-    
-    fig_cfr = go.Figure(go.Scatter(
-        x=df_cfr['variant'],
-        y=df_cfr['cfr'],
-        mode='lines+markers',
-        line=dict(color='#ef4444', width=3),
-        marker=dict(
-            size=12,
-            color='#dc2626',
-            line=dict(color='white', width=2)
-        ),
-        fill='tozeroy',
-        fillcolor='rgba(239, 68, 68, 0.2)'
-    ))
-    
-    fig_cfr.update_layout(
-        title='📉 변이별 치명률(CFR) 변화',
-        plot_bgcolor='#1e293b',
-        paper_bgcolor='#1e293b',
-        font=dict(color='#cbd5e1', family='Noto Sans KR'),
-        xaxis=dict(gridcolor='#334155', title='변이'),
-        yaxis=dict(gridcolor='#334155', title='치명률 (%)', range=[0, 2.5]),
-        height=400,
-        showlegend=False,
-        annotations=[
-            dict(
-                x=0.5,
-                y=-0.25,
-                xref='paper',
-                yref='paper',
-                text='💡 분석 포인트: 델타(0.95%) - 폐렴 등 위중증 위험 높음 | 오미크론(~0.1%) - 상기도 감염 위주, 치명률 급감',
-                showarrow=False,
-                font=dict(size=11, color='#94a3b8', family='Noto Sans KR'),
-                xanchor='center'
-            )
-        ]
-    )
-    st.plotly_chart(fig_cfr, use_container_width=True)
+    with col1:
+        fig_variants = charts.variants()
+        st.plotly_chart(fig_variants, use_container_width=True)
+
+    with col2:
+        fig_cfr = charts.cfr()
+        st.plotly_chart(fig_cfr, use_container_width=True)
+
+    st.write("")
+
+    # 월간 국가별 추이 (CSV를 국가 × 월 행렬로 한 번만 변환해서 사용)
+    st.markdown('<h3 class="section-title" style="font-size:1.8rem">국가별 월간 추이</h3>', unsafe_allow_html=True)
+
+    monthly_mtime = monthly.source_mtime()
+    monthly_views = get_monthly(monthly_mtime)
+    view = st.radio(
+        "보기", list(charts.MONTHLY_VIEW_LABELS), format_func=charts.MONTHLY_VIEW_LABELS.get,
+        horizontal=True, key='monthly_view', label_visibility='collapsed')
+
+    fig_monthly = charts.monthly_lines(monthly_views, monthly_mtime, view)
+    st.plotly_chart(fig_monthly, use_container_width=True)
+
+indepth_section()
 
 st.write("---")
 # 바이러스 구조 탐색
@@ -891,11 +757,11 @@ variant_info = {
     }
 }
 
-col_left, col_right = st.columns([2.5, 1])
+# 바이러스 3D 모델 (원본과 완전 동일)
+VIRUS_TEMPLATE_VERSION = 1
 
-with col_left:
-    # 바이러스 3D 모델 (원본과 완전 동일)
-    virus_html = """
+def build_virus_html():
+    return """
     <!DOCTYPE html>
     <html>
     <head>
@@ -1028,51 +894,62 @@ with col_left:
     </body>
     </html>
     """
-    
-    components.html(virus_html, height=620)
 
-with col_right:
+@st.fragment
+@perf.timed('variant_panel')
+def variant_panel():
+    """변이 선택 패널. 버튼을 눌러도 이 패널만 다시 실행됨"""
     st.markdown("### 🧬 변이 바이러스 선택")
-    
+
     # 세션 상태 초기화
     if 'selected_variant' not in st.session_state:
         st.session_state.selected_variant = 'original'
-    
+
     # 버튼 그리드 (원본과 동일하게 3×2)
     cols = st.columns(3)
     variants = ['original', 'alpha', 'beta', 'gamma', 'delta', 'omicron']
     variant_names = ['초기형', '알파', '베타', '감마', '델타', '오미크론']
-    
+
     for idx, (var, name) in enumerate(zip(variants, variant_names)):
         with cols[idx % 3]:
             if st.button(name, key=f'var_{var}', use_container_width=True):
                 st.session_state.selected_variant = var
-    
+
     st.write("")
-    
+
     # 선택된 변이 정보
     info = variant_info[st.session_state.selected_variant]
-    
+
     st.markdown(f"**{info['name']}**")
     st.info(info['desc'])
-    
+
     st.markdown("#### 📊 주요 특징 통계")
     col_a, col_b = st.columns(2)
     with col_a:
         st.metric("스파이크 단백질", info['spike_count'])
     with col_b:
         st.metric("전파력", info['transmissibility'])
-    
+
     st.markdown("#### ✨ 바이러스 특성")
     for char in info['characteristics']:
         st.markdown(f"- {char}")
-    
+
     st.markdown("#### 🧪 주요 변이 정보")
     st.success(info['mutations'])
-    
+
     st.markdown("#### 🔍 구조적 차이점")
     st.warning(info['structural_diff'])
 
+
+col_left, col_right = st.columns([2.5, 1])
+
+with col_left:
+    virus_html = render_cache.cache.render('virus', VIRUS_TEMPLATE_VERSION, None, (), build_virus_html)
+    components.html(virus_html, height=620)
+
+with col_right:
+    variant_panel()
+
 st.write("")
 
 # Footer (원본과 완전 동일)
@@ -0,0 +1,229 @@
+# artifact.py 준비된 데이터셋(타임라인, 국가 × 날짜 행렬, 도시)을 메모리 맵 파일 하나로 빌드/공유
+#
+# 파일 구조: MAGIC(8) + 헤더 길이(8, little endian) + JSON 헤더 + 64바이트 정렬된 원시 배열들.
+# 모든 워커 프로세스가 같은 파일을 읽기 전용으로 매핑하므로 OS 페이지 캐시의 같은 페이지를 공유하고,
+# 데이터프레임/행렬은 그 위의 복사 없는 NumPy 뷰라서 프로세스/세션이 늘어도 메모리가 늘지 않음
+#
+#   python artifact.py          # 저장소(없으면 기본 데이터)에서 빌드
+#   python artifact.py info     # 헤더 정보 출력
+
+import argparse
+import functools
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import compact
+import series
+import store
+import synthetic
+
+ARTIFACT_PATH = os.path.join(store.STORE_DIR, 'datasets.mmap')
+
+MAGIC = b'COVIDART'
+FORMAT_VERSION = 1
+# 배열 시작 위치 정렬 (캐시 라인 / SIMD 정렬)
+ALIGN = 64
+
+# 아티팩트를 만드는 저장소 데이터셋. 이 데이터셋의 버전이 바뀔 때만 아티팩트를 다시 만듦
+DATASETS = ('timeline', 'cities')
+
+
+def _align(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _dataset_versions():
+    """{데이터셋 이름: 저장소 버전 (없으면 None)}. manifest는 한 번만 읽음"""
+    datasets = store.load_manifest()['datasets']
+    return {name: datasets[name]['version'] if name in datasets else None for name in DATASETS}
+
+
+def _columns(table, df):
+    """
+    데이터프레임 → {"표/열": 배열}, {"표/열": 카테고리 목록}.
+    문자열 열은 category 코드(int)와 카테고리 목록으로 나눠서 저장
+    """
+    arrays, categories = {}, {}
+    for col in df.columns:
+        values = df[col]
+        if not pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+            values = values.astype('category')
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            categories[f'{table}/{col}'] = [str(c) for c in values.cat.categories]
+            values = values.cat.codes
+        arrays[f'{table}/{col}'] = np.ascontiguousarray(values.to_numpy())
+    return arrays, categories
+
+
+def write(path, arrays, meta):
+    """
+    배열 dict를 아티팩트 파일로 저장 (임시 파일에 쓰고 교체).
+    이미 이전 파일을 매핑한 프로세스는 교체 후에도 이전 내용을 그대로 읽음
+    """
+    entries = {}
+    offset = 0
+    for name, values in arrays.items():
+        offset = _align(offset)
+        entries[name] = {'dtype': values.dtype.str, 'shape': list(values.shape), 'offset': offset}
+        offset += values.nbytes
+    header = json.dumps({'format': FORMAT_VERSION, 'arrays': entries, 'meta': meta},
+                        ensure_ascii=False).encode('utf-8')
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.datasets-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            for name, values in arrays.items():
+                f.seek(data_start + entries[name]['offset'])
+                f.write(values.tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def build(timeline, cities, multipliers=synthetic.COUNTRY_MULTIPLIERS, path=ARTIFACT_PATH, source='store'):
+    """
+    타임라인(압축), 국가 × 날짜 행렬(기준 타임라인 × 배율), 도시 목록을 아티팩트로 빌드.
+    cities는 데이터프레임 또는 레코드 리스트
+    """
+    timeline = compact.compact_frame(timeline)
+    cities = pd.DataFrame(cities)
+    countries = series.from_multipliers(compact.dates(timeline), timeline['cases'].to_numpy(), multipliers)
+
+    arrays, categories = {}, {}
+    for table, df in (('timeline', timeline), ('cities', cities)):
+        table_arrays, table_categories = _columns(table, df)
+        arrays.update(table_arrays)
+        categories.update(table_categories)
+    arrays['countries/matrix'] = countries.matrix
+
+    meta = {
+        'built_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'source': source,
+        # 빌드 이후 원본 데이터셋이 갱신됐는지 확인하는 용도 (is_current).
+        # 저장소 전체 버전을 쓰면 다른 데이터셋(historical_all 등)만 바뀌어도 모든 워커가 매핑을 버림
+        'dataset_versions': _dataset_versions(),
+        # 타임라인 변경 이력 (추가된 날짜 범위별 차트 캐시 키, ingest.range_version)
+        'revisions': store.dataset_revisions('timeline') if source == 'store' else [],
+        'tables': {'timeline': list(timeline.columns), 'cities': list(cities.columns)},
+        'categories': categories,
+        'countries': countries.names,
+    }
+    write(path, arrays, meta)
+    return path
+
+
+def build_local(path=ARTIFACT_PATH):
+    """로컬 저장소(없으면 기본 데이터)에서 빌드. 네트워크는 사용하지 않음"""
+    timeline = store.read_dataset('timeline')
+    cities = store.read_dataset('cities')
+    if timeline is None or cities is None:
+        return build(synthetic.generate_timeline(), synthetic.DEFAULT_CITIES, path=path, source='fallback')
+    return build(timeline, cities, path=path)
+
+
+class Artifact:
+    """
+    아티팩트 파일 하나를 읽기 전용으로 매핑. array/frame/country_series는 모두 매핑 위의 뷰 (복사 없음)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._map = np.memmap(path, dtype=np.uint8, mode='r')
+        if bytes(self._map[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"아티팩트 파일이 아닙니다: {path}")
+        header_len = int.from_bytes(bytes(self._map[len(MAGIC):len(MAGIC) + 8]), 'little')
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(self._map[header_start:header_start + header_len]))
+        if header['format'] != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 아티팩트 형식: {header['format']}")
+        self.entries = header['arrays']
+        self._data_start = _align(header_start + header_len)
+        self.meta = header['meta']
+
+    def is_current(self):
+        """빌드한 뒤로 원본 데이터셋(DATASETS)이 바뀌지 않았는지"""
+        return self.meta.get('dataset_versions') == _dataset_versions()
+
+    def array(self, name):
+        """원시 배열 (읽기 전용 뷰)"""
+        entry = self.entries[name]
+        dtype = np.dtype(entry['dtype'])
+        count = int(np.prod(entry['shape']))
+        start = self._data_start + entry['offset']
+        return self._map[start:start + count * dtype.itemsize].view(dtype).reshape(entry['shape'])
+
+    def frame(self, table):
+        """
+        표 하나를 데이터프레임으로. 숫자 열은 매핑 위의 뷰를 그대로 쓰고(copy=False),
+        문자열 열은 저장된 코드 + 카테고리로 category 열을 만듦
+        """
+        columns = {}
+        for col in self.meta['tables'][table]:
+            name = f'{table}/{col}'
+            values = self.array(name)
+            if name in self.meta['categories']:
+                values = pd.Categorical.from_codes(values, categories=self.meta['categories'][name])
+            columns[col] = values
+        return pd.DataFrame(columns, copy=False)
+
+    def country_series(self):
+        """국가 × 날짜 누적 확진 행렬 (CountrySeries, 행렬은 매핑 위의 뷰)"""
+        return series.CountrySeries(self.meta['countries'], compact.dates(self.frame('timeline')),
+                                    self.array('countries/matrix'))
+
+    def data(self):
+        """앱 스냅샷 형식 {'timeline', 'cities', 'countries'}"""
+        return {
+            'timeline': self.frame('timeline'),
+            'cities': self.frame('cities').to_dict('records'),
+            'countries': self.country_series(),
+            'revisions': self.meta.get('revisions', []),
+        }
+
+
+@functools.lru_cache(maxsize=4)
+def _open(path, mtime):
+    return Artifact(path)
+
+
+def open_artifact(path=ARTIFACT_PATH):
+    """
+    아티팩트 매핑 (파일이 바뀌지 않았으면 프로세스 안에서 같은 객체를 재사용).
+    파일이 없거나 읽을 수 없으면 None
+    """
+    try:
+        return _open(path, os.path.getmtime(path))
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"[artifact] 읽기 실패 ({e})")
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='데이터셋 메모리 맵 아티팩트 빌드')
+    parser.add_argument('command', nargs='?', default='build', choices=['build', 'info'])
+    parser.add_argument('--path', default=ARTIFACT_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build_local(args.path)
+
+    artifact = open_artifact(args.path)
+    if artifact is None:
+        sys.exit(f"아티팩트가 없습니다: {args.path}")
+    print(f"{args.path} ({os.path.getsize(args.path):,} bytes, {artifact.meta['source']}, {artifact.meta['built_at']})")
+    for name, entry in artifact.entries.items():
+        print(f"  {name:<20}{entry['dtype']:>6}  {tuple(entry['shape'])}")
@@ -0,0 +1,146 @@
+# bench.py 차트 생성/직렬화 경로 벤치마크
+#
+#   python bench.py figures       # go.Figure vs figspec (차트 종류별)
+#   python bench.py serialization # 기존 인코더 vs serialization (현재 규모 / 100배)
+
+import argparse
+import json
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import figspec
+import serialization
+import synthetic
+
+DARK_LAYOUT = dict(
+    plot_bgcolor='#1e293b',
+    paper_bgcolor='#1e293b',
+    font=dict(color='#cbd5e1', family='Noto Sans KR'),
+    xaxis=dict(gridcolor='#334155'),
+    yaxis=dict(gridcolor='#334155'),
+)
+
+
+def timeit(func, repeat=5):
+    """repeat번 실행해서 가장 빠른 시간 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _figure_cases():
+    """차트 종류별 (이름, go.Figure 빌더, figspec 빌더)"""
+    timeline = synthetic.generate_timeline()
+    countries = synthetic.generate_countries(7)
+    matrix = countries['cases'].to_numpy().reshape(7, -1)
+    dates = timeline['date'].to_numpy()
+    names = [f"Country {i}" for i in range(190)]
+    values = np.random.default_rng(0).integers(0, 5_000_000, size=(3, 190))
+    categories = ['발열', '기침', '인후통', '두통', '근육통', '후각상실', '미각상실']
+
+    def line_go():
+        fig = go.Figure(go.Scatter(x=dates, y=timeline['cases'], fill='tozeroy', line=dict(color='#60a5fa', width=2)))
+        fig.update_layout(**DARK_LAYOUT, height=400)
+        return fig
+
+    def line_spec():
+        return figspec.figure([figspec.scatter(x=dates, y=timeline['cases'], fill='tozeroy',
+                                               line=dict(color='#60a5fa', width=2))], dict(height=400))
+
+    def multi_go():
+        fig = go.Figure()
+        for row in matrix:
+            fig.add_trace(go.Scatter(x=dates, y=row, mode='lines', line=dict(width=2)))
+        fig.update_layout(**DARK_LAYOUT, height=500, hovermode='x unified')
+        return fig
+
+    def multi_spec():
+        return figspec.figure([figspec.scatter(x=dates, y=row, mode='lines', line=dict(width=2)) for row in matrix],
+                              dict(height=500, hovermode='x unified'))
+
+    def bars_go():
+        fig = go.Figure()
+        for row, color in zip(values, ['#1f77b4', '#00cc96', '#ef553b']):
+            fig.add_trace(go.Bar(x=names, y=row, marker_color=color, opacity=0.8))
+        fig.update_layout(**DARK_LAYOUT, barmode='overlay', height=600, xaxis_tickangle=-45)
+        return fig
+
+    def bars_spec():
+        return figspec.figure([figspec.bar(x=names, y=row, marker=dict(color=color), opacity=0.8)
+                               for row, color in zip(values, ['#1f77b4', '#00cc96', '#ef553b'])],
+                              dict(barmode='overlay', height=600, xaxis=dict(tickangle=-45)))
+
+    def radar_go():
+        fig = go.Figure()
+        for r in ([78, 82, 65, 71, 69, 42, 38], [54, 70, 88, 84, 76, 18, 15]):
+            fig.add_trace(go.Scatterpolar(r=r, theta=categories, fill='toself'))
+        fig.update_layout(**DARK_LAYOUT, polar=dict(radialaxis=dict(range=[0, 100])), height=450)
+        return fig
+
+    def radar_spec():
+        return figspec.figure([figspec.scatterpolar(r=r, theta=categories, fill='toself')
+                               for r in ([78, 82, 65, 71, 69, 42, 38], [54, 70, 88, 84, 76, 18, 15])],
+                              dict(polar=dict(radialaxis=dict(range=[0, 100])), height=450))
+
+    return [
+        ('line (2,195점)', line_go, line_spec),
+        ('lines 7개 (15,365점)', multi_go, multi_spec),
+        ('bar 190개 × 3', bars_go, bars_spec),
+        ('radar 2개', radar_go, radar_spec),
+    ]
+
+
+def bench_figures():
+    print(f"{'차트':<22}{'go.Figure':>12}{'figspec':>12}{'배율':>8}")
+    for name, build_go, build_spec in _figure_cases():
+        # 둘 다 st.plotly_chart가 하는 일(생성 + JSON 직렬화)까지 측정
+        go_ms = timeit(lambda: pio.to_json(build_go().to_dict(), validate=False))
+        spec_ms = timeit(lambda: pio.to_json(build_spec(), validate=False))
+        print(f"{name:<22}{go_ms:>10.1f}ms{spec_ms:>10.1f}ms{go_ms / spec_ms:>7.1f}x")
+
+
+def _serialization_cases(scale):
+    """(이름, 기존 인코더, serialization) 목록. scale배 규모의 데이터로"""
+    timeline = synthetic.generate_timeline(days=synthetic.DAYS * scale)
+    cities = synthetic.generate_cities(10 * scale).to_dict('records')
+    spec = figspec.figure([figspec.scatter(x=timeline['date'], y=timeline['cases'], mode='lines')])
+
+    return [
+        ('timeline (df.to_json)', lambda: timeline.to_json(orient='records', date_format='iso'),
+         lambda: serialization.dumps(timeline)),
+        ('cities (json.dumps)', lambda: json.dumps(cities), lambda: serialization.dumps(cities)),
+        ('figure (pio.to_json)', lambda: pio.to_json(spec, validate=False), lambda: serialization.dumps(spec)),
+    ]
+
+
+def bench_serialization():
+    engine = 'orjson' if serialization.orjson is not None else 'json'
+    print(f"{'데이터':<26}{'규모':>6}{'기존':>12}{engine:>12}{'배율':>8}")
+    for scale in (1, 100):
+        for name, baseline, fast in _serialization_cases(scale):
+            base_ms = timeit(baseline, repeat=3)
+            fast_ms = timeit(fast, repeat=3)
+            print(f"{name:<26}{scale:>5}x{base_ms:>10.1f}ms{fast_ms:>10.1f}ms{base_ms / fast_ms:>7.1f}x")
+
+
+BENCHMARKS = {
+    'figures': bench_figures,
+    'serialization': bench_serialization,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='차트 생성/직렬화 벤치마크')
+    parser.add_argument('names', nargs='*', metavar='name', help=f"{', '.join(BENCHMARKS)} (기본: 전부)")
+    args = parser.parse_args()
+    for name in args.names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            parser.error(f"알 수 없는 벤치마크: {name}")
+        print(f"== {name}")
+        BENCHMARKS[name]()
@@ -0,0 +1,388 @@
+# charts.py 대시보드 Plotly 차트 (figure_cache를 거쳐서 반환)
+#
+# 섹션 렌더링과 로딩 화면의 미리 만들기(warm_up)가 같은 함수를 불러서 캐시 키가 항상 같음.
+# 기본 보기(전체 기간, 누적 확진자)를 로딩 중에 만들어 두면 첫 화면은 캐시에서 바로 나감
+
+import pandas as pd
+
+import compact
+import countries
+import downsample
+import figspec
+import figure_cache
+import ingest
+import synthetic
+import traces
+
+# 차트 색상 테마. 차트 캐시 키에 들어가므로 테마를 바꾸면 차트가 새로 만들어짐
+THEME = 'dark'
+
+# 주요 국가별 누적 확진 차트의 국가와 배율
+COUNTRIES_CONFIG = synthetic.COUNTRY_MULTIPLIERS
+
+# 월간 국가별 차트 보기 (첫 번째가 기본 보기)
+MONTHLY_VIEW_LABELS = {
+    'cumulative': '누적 확진자',
+    'new': '월간 신규 확진자',
+    'deaths': '누적 사망자'
+}
+
+SYMPTOMS_DATA = {
+    '증상': ['발열', '기침', '인후통', '두통', '근육통', '후각상실', '미각상실'],
+    '델타': [78, 82, 65, 71, 69, 42, 38],
+    '오미크론': [54, 70, 88, 84, 76, 18, 15]
+}
+
+VACCINE_DATA = {
+    'vaccine': ['Pfizer-BioNTech', 'Moderna', 'AstraZeneca', 'Johnson & Johnson', 'Sinovac'],
+    'efficacy': [95, 94, 70, 66, 51]
+}
+
+DIAGNOSIS_DATA = {
+    'test': ['PCR', '신속항원검사', '항체검사'],
+    'accuracy': [99, 85, 80]
+}
+
+VARIANTS_TIMELINE = {
+    'variant': ['Original', 'Alpha', 'Beta', 'Gamma', 'Delta', 'Omicron'],
+    'duration': [240, 120, 180, 150, 270, 700],
+    'color': ['#64748b', '#ef4444', '#f97316', '#fbbf24', '#dc2626', '#60a5fa']
+}
+
+CFR_DATA = {
+    'variant': ['Original', 'Alpha', 'Beta', 'Gamma', 'Delta', 'Omicron'],
+    'cfr': [2.1, 1.8, 1.5, 1.3, 0.95, 0.1]
+}
+
+
+def range_version(data, data_version, start, end):
+    """
+    기간 차트의 캐시 키 버전. 새로 추가된 날짜 범위와 겹치지 않는 기간이면
+    데이터가 갱신돼도 이전 차트 캐시를 그대로 씀
+    """
+    revision = ingest.range_version(data.get('revisions'), start, end)
+    return ('store', revision) if revision is not None else data_version
+
+
+def _timeline_figure(timeline_dates, values, start, end, title, color, fillcolor, name):
+    dates, values = downsample.lttb_range(timeline_dates.to_numpy(), values, start, end)
+    return figspec.figure(
+        [traces.scatter(
+            dates, values,
+            fill='tozeroy',
+            fillcolor=fillcolor,
+            line=dict(color=color, width=2),
+            name=name
+        )],
+        dict(
+            title=title,
+            xaxis=dict(showgrid=True),
+            yaxis=dict(showgrid=True),
+            height=400,
+            margin=dict(l=20, r=20, t=60, b=20),
+            showlegend=False
+        )
+    )
+
+
+def cases(df, timeline_dates, version, start, end):
+    """전 세계 누적 확진자 추이 (기간마다 LTTB로 줄인 점만)"""
+    return figure_cache.cache.figure(
+        'cases', version, THEME,
+        lambda: _timeline_figure(timeline_dates, df['cases'].to_numpy(), start, end,
+                                 '📉 전 세계 확진자 추이', '#60a5fa', 'rgba(96, 165, 250, 0.2)', '누적 확진자'),
+        (start, end))
+
+
+def deaths(df, timeline_dates, version, start, end):
+    """전 세계 누적 사망자 추이"""
+    return figure_cache.cache.figure(
+        'deaths', version, THEME,
+        lambda: _timeline_figure(timeline_dates, df['deaths'].to_numpy(), start, end,
+                                 '💔 전 세계 사망자 추이', '#f87171', 'rgba(248, 113, 113, 0.2)', '누적 사망자'),
+        (start, end))
+
+
+def country_lines(country_series, version, start, end):
+    """주요 국가별 누적 확진 (국가 × 날짜 행렬에서 기간만 잘라서 샘플링)"""
+    def build():
+        colors = ['#60a5fa', '#f87171', '#34d399', '#fbbf24', '#a78bfa', '#f472b6', '#fb923c']
+        names = list(COUNTRIES_CONFIG.keys())
+        dates, values = country_series.downsampled(names, start, end)
+
+        # 점이 많으면 WebGL, 국가가 많으면 색상별로 트레이스를 합쳐서 그림
+        return figspec.figure(
+            traces.lines(dates, values, names, [colors[idx % len(colors)] for idx in range(len(names))]),
+            dict(
+                title='',
+                xaxis=dict(title='날짜'),
+                yaxis=dict(title='누적 확진자'),
+                height=500,
+                legend=dict(
+                    orientation='h',
+                    yanchor='bottom',
+                    y=1.02,
+                    xanchor='right',
+                    x=1
+                ),
+                hovermode='x unified'
+            )
+        )
+
+    return figure_cache.cache.figure('countries', version, THEME, build, (start, end))
+
+
+def symptoms_radar():
+    def build():
+        df_symptoms = pd.DataFrame(SYMPTOMS_DATA)
+        return figspec.figure(
+            [
+                figspec.scatterpolar(
+                    r=df_symptoms['델타'],
+                    theta=df_symptoms['증상'],
+                    fill='toself',
+                    fillcolor='rgba(239, 68, 68, 0.2)',
+                    line=dict(color='#ef4444', width=2),
+                    name='Delta (델타)'
+                ),
+                figspec.scatterpolar(
+                    r=df_symptoms['오미크론'],
+                    theta=df_symptoms['증상'],
+                    fill='toself',
+                    fillcolor='rgba(96, 165, 250, 0.2)',
+                    line=dict(color='#60a5fa', width=2),
+                    name='Omicron (오미크론)'
+                )
+            ],
+            dict(
+                polar=dict(
+                    radialaxis=dict(
+                        visible=True,
+                        range=[0, 100],
+                        gridcolor='#334155',
+                        color='#cbd5e1'
+                    ),
+                    angularaxis=dict(
+                        gridcolor='#334155',
+                        color='#cbd5e1'
+                    ),
+                    bgcolor='#1e293b'
+                ),
+                title='🎯 증상 레이더 차트',
+                height=450,
+                showlegend=True,
+                legend=dict(
+                    orientation='h',
+                    yanchor='bottom',
+                    y=-0.2,
+                    xanchor='center',
+                    x=0.5
+                )
+            )
+        )
+
+    return figure_cache.cache.figure('radar', None, THEME, build)
+
+
+def symptoms_bar():
+    def build():
+        df_symptoms = pd.DataFrame(SYMPTOMS_DATA)
+        return figspec.figure(
+            [
+                figspec.bar(
+                    x=df_symptoms['증상'],
+                    y=df_symptoms['델타'],
+                    name='Delta (델타)',
+                    marker=dict(color='#ef4444')
+                ),
+                figspec.bar(
+                    x=df_symptoms['증상'],
+                    y=df_symptoms['오미크론'],
+                    name='Omicron (오미크론)',
+                    marker=dict(color='#60a5fa')
+                )
+            ],
+            dict(
+                barmode='group',
+                title='📊 증상 막대 차트',
+                xaxis=dict(title='증상'),
+                yaxis=dict(title='발현율 (%)', range=[0, 100]),
+                height=450,
+                legend=dict(
+                    orientation='h',
+                    yanchor='bottom',
+                    y=-0.3,
+                    xanchor='center',
+                    x=0.5
+                )
+            )
+        )
+
+    return figure_cache.cache.figure('bar', None, THEME, build)
+
+
+def vaccine():
+    def build():
+        df_vaccine = pd.DataFrame(VACCINE_DATA)
+        return figspec.figure(
+            [figspec.bar(
+                x=df_vaccine['efficacy'],
+                y=df_vaccine['vaccine'],
+                orientation='h',
+                marker=dict(
+                    color=df_vaccine['efficacy'],
+                    colorscale=[[0, '#ef4444'], [0.5, '#fbbf24'], [1, '#34d399']],
+                    showscale=False
+                ),
+                text=df_vaccine['efficacy'].apply(lambda x: f'{x}%'),
+                textposition='inside',
+                textfont=dict(size=14, color='white', family='Noto Sans KR')
+            )],
+            dict(
+                title='💉 백신 예방 효능',
+                xaxis=dict(title='효능 (%)', range=[0, 100]),
+                yaxis=dict(title=''),
+                height=400,
+                showlegend=False
+            )
+        )
+
+    return figure_cache.cache.figure('vaccine', None, THEME, build)
+
+
+def diagnosis():
+    def build():
+        df_diagnosis = pd.DataFrame(DIAGNOSIS_DATA)
+        return figspec.figure(
+            [figspec.bar(
+                x=df_diagnosis['test'],
+                y=df_diagnosis['accuracy'],
+                marker=dict(color=['#60a5fa', '#34d399', '#fbbf24']),
+                text=df_diagnosis['accuracy'].apply(lambda x: f'{x}%'),
+                textposition='outside',
+                textfont=dict(size=14, family='Noto Sans KR')
+            )],
+            dict(
+                title='🔬 진단 검사 정확도',
+                xaxis=dict(title='검사 방법'),
+                yaxis=dict(title='정확도 (%)', range=[0, 110]),
+                height=400,
+                showlegend=False
+            )
+        )
+
+    return figure_cache.cache.figure('diagnosis', None, THEME, build)
+
+
+def variants():
+    def build():
+        df_variants = pd.DataFrame(VARIANTS_TIMELINE)
+        return figspec.figure(
+            [figspec.bar(
+                x=df_variants['duration'],
+                y=df_variants['variant'],
+                orientation='h',
+                marker=dict(color=df_variants['color']),
+                text=df_variants['duration'].apply(lambda x: f'{x}일'),
+                textposition='inside',
+                textfont=dict(size=14, color='white', family='Noto Sans KR')
+            )],
+            dict(
+                title='⏳ 변이별 우세 지속 기간',
+                xaxis=dict(title='지속 일수'),
+                yaxis=dict(title=''),
+                height=400,
+                showlegend=False
+            )
+        )
+
+    return figure_cache.cache.figure('variants', None, THEME, build)
+
+
+def cfr():
+    def build():
+        df_cfr = pd.DataFrame(CFR_DATA)
+        return figspec.figure(
+            [figspec.scatter(
+                x=df_cfr['variant'],
+                y=df_cfr['cfr'],
+                mode='lines+markers',
+                line=dict(color='#ef4444', width=3),
+                marker=dict(
+                    size=12,
+                    color='#dc2626',
+                    line=dict(color='white', width=2)
+                ),
+                fill='tozeroy',
+                fillcolor='rgba(239, 68, 68, 0.2)'
+            )],
+            dict(
+                title='📉 변이별 치명률(CFR) 변화',
+                xaxis=dict(title='변이'),
+                yaxis=dict(title='치명률 (%)', range=[0, 2.5]),
+                height=400,
+                showlegend=False,
+                annotations=[
+                    dict(
+                        x=0.5,
+                        y=-0.25,
+                        xref='paper',
+                        yref='paper',
+                        text='💡 분석 포인트: 델타(0.95%) - 폐렴 등 위중증 위험 높음 | 오미크론(~0.1%) - 상기도 감염 위주, 치명률 급감',
+                        showarrow=False,
+                        font=dict(size=11, color='#94a3b8', family='Noto Sans KR'),
+                        xanchor='center'
+                    )
+                ]
+            )
+        )
+
+    return figure_cache.cache.figure('cfr', None, THEME, build)
+
+
+def monthly_lines(monthly_views, monthly_mtime, view):
+    """월간 국가별 추이 (보기별 국가 × 월 행렬)"""
+    def build():
+        data = monthly_views[view]
+        colors = ['#60a5fa', '#f87171', '#34d399', '#fbbf24', '#a78bfa', '#f472b6', '#fb923c', '#2dd4bf', '#94a3b8']
+        # CSV의 WHO 공식명('Republic of Korea')을 국가 인덱스로 한국어 이름으로 바꿈
+        country_index = countries.load_index()
+        names = [country_index.display(name) for name in data.names]
+
+        return figspec.figure(
+            traces.lines(
+                [data.dates] * len(data), data.matrix, names,
+                [colors[idx % len(colors)] for idx in range(len(names))]),
+            dict(
+                xaxis=dict(title='월'),
+                yaxis=dict(title=MONTHLY_VIEW_LABELS[view]),
+                height=450,
+                legend=dict(
+                    orientation='h',
+                    yanchor='bottom',
+                    y=1.02,
+                    xanchor='right',
+                    x=1
+                ),
+                hovermode='x unified'
+            )
+        )
+
+    return figure_cache.cache.figure('monthly', monthly_mtime, THEME, build, (view,))
+
+
+def warm_up(data, data_version, country_series, monthly_views, monthly_mtime):
+    """
+    첫 화면의 기본 보기(전체 기간, 월간 누적 확진자) 차트를 모두 캐시에 만들어 둠.
+    섹션은 같은 함수와 같은 인자로 부르므로 첫 렌더링이 캐시에서 바로 나감
+    """
+    df = data['timeline']
+    timeline_dates = compact.dates(df)
+    start, end = timeline_dates[0].date(), timeline_dates[-1].date()
+    version = range_version(data, data_version, start, end)
+    cases(df, timeline_dates, version, start, end)
+    deaths(df, timeline_dates, version, start, end)
+    country_lines(country_series, version, start, end)
+    for build in (symptoms_radar, symptoms_bar, vaccine, diagnosis, variants, cfr):
+        build()
+    monthly_lines(monthly_views, monthly_mtime, next(iter(MONTHLY_VIEW_LABELS)))
@@ -0,0 +1,94 @@
+# circuit.py 업스트림(disease.sh, GitHub)별 서킷 브레이커
+
+import threading
+import time
+
+# 연속 실패가 이 횟수에 도달하면 차단(open)
+FAILURE_THRESHOLD = 3
+# 차단 후 다시 시험 요청을 보내기까지 대기 시간 (초)
+COOLDOWN = 60
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """차단된 업스트림으로 요청하려 할 때 발생 (네트워크를 쓰지 않고 바로 실패)"""
+
+
+class CircuitBreaker:
+    """
+    closed: 정상 요청
+    open: FAILURE_THRESHOLD번 연속 실패 후 COOLDOWN 동안 요청하지 않고 바로 실패
+    half_open: COOLDOWN이 지나면 요청 하나만 시험 삼아 통과, 성공하면 closed / 실패하면 다시 open
+    """
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._last_error = None
+
+    def allow(self):
+        """이번 요청을 보내도 되는지"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.time() - self._opened_at >= self.cooldown:
+                # 시험 요청은 하나만 통과시키고 나머지는 결과가 나올 때까지 계속 차단
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._last_error = None
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self._failures += 1
+            self._last_error = repr(error) if error is not None else None
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.time()
+
+    def state(self):
+        """현재 상태 (화면 표시/모니터링용)"""
+        with self._lock:
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.cooldown - (time.time() - self._opened_at))
+            return {
+                'state': self._state,
+                'failures': self._failures,
+                'retry_in': round(retry_in, 1),
+                'last_error': self._last_error,
+            }
+
+
+_breakers = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name):
+    """업스트림 이름(호스트)별 브레이커. 프로세스 안에서 공유"""
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
+
+
+def breaker_states():
+    """모든 브레이커 상태 {이름: state dict}"""
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.state() for breaker in breakers}
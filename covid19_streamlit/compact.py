@@ -0,0 +1,157 @@
+# compact.py 데이터프레임을 메모리를 적게 쓰는 타입으로 바꾸는 압축 단계 + 압축 전후 메모리 리포트
+#
+# 변환 규칙:
+#   - 정수 (건수)          → 값이 들어가는 가장 작은 부호 있는 정수 (int8/16/32/64)
+#   - 실수 (비율, 좌표)     → float32 (float_dtype=None이면 그대로. 값을 라벨로 표시하는 데이터용)
+#   - 문자열 (국가, WHO 지역) → category
+#   - 날짜 (시각 없음)      → EPOCH 기준 일 단위 오프셋 int32 (dates()로 다시 날짜로)
+#
+# 목표는 4배(TARGET_RATIO)지만 측정값은 그에 못 미침 (pandas 3, 리포트 기준):
+#   - 일별 국가 데이터 (190개국) 3.1x: 국가 문자열(category)이 대부분이고, 건수는 int32가 필요함
+#   - timeline 2.0x: 반복 문자열이 없고 누적 건수가 int16을 넘어서 int64 → int32 절반이 최대
+#   - country_wise_latest.csv 1.6x: 비율은 라벨 표시 때문에 float64로 둠 (kaggle_data)
+#
+#   python compact.py   # 데이터셋별 압축 전/후 메모리 리포트 (목표 미달 데이터셋 표시)
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+import store
+import synthetic
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+KAGGLE_CSV = os.path.join(BASE_DIR, '..', 'covid-19-dashboard', 'country_wise_latest.csv')
+
+# 날짜 오프셋의 기준일. 모든 데이터셋이 같은 기준을 써서 오프셋끼리 바로 비교/조인할 수 있음
+EPOCH = np.datetime64('2020-01-01', 'D')
+
+SIGNED_INTS = [np.int8, np.int16, np.int32, np.int64]
+
+# 이미 일 오프셋(정수)으로 바뀐 날짜 열. 다시 압축할 때 더 작은 정수로 줄이지 않고 int32로 둠
+DATE_COLUMNS = ('date',)
+
+# 워커당 데이터셋 메모리 감소 목표 (압축 전 / 후)
+TARGET_RATIO = 4.0
+
+
+def int_dtype(values):
+    """values가 모두 들어가는 가장 작은 부호 있는 정수 타입 (증가량 계산 시 언더플로가 없도록 unsigned는 쓰지 않음)"""
+    values = np.asarray(values)
+    if values.size == 0:
+        return np.dtype(np.int8)
+    lo, hi = values.min(), values.max()
+    for dtype in SIGNED_INTS:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _day_offsets(values):
+    """시각이 없는 날짜 열 → int32 일 오프셋. NaT가 있거나 시각이 있으면 None (그대로 둠)"""
+    days = values.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    if pd.isna(values).any() or not np.array_equal(days.astype('datetime64[ns]'), values.to_numpy(dtype='datetime64[ns]')):
+        return None
+    return (days - EPOCH).astype(np.int32)
+
+
+def compact_frame(df, date_columns=DATE_COLUMNS, float_dtype=np.float32):
+    """
+    규칙에 따라 열 타입을 줄인 새 데이터프레임 (원본은 그대로).
+    이미 압축된 프레임에 다시 적용해도 결과가 같음
+    """
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        dtype = values.dtype
+        if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+            columns[col] = values
+        elif pd.api.types.is_datetime64_dtype(dtype):
+            offsets = _day_offsets(values)
+            columns[col] = values if offsets is None else pd.Series(offsets, index=df.index)
+        elif col in date_columns and pd.api.types.is_integer_dtype(dtype):
+            columns[col] = values.astype(np.int32)
+        elif pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            columns[col] = values.astype(int_dtype(values.to_numpy()))
+        elif pd.api.types.is_float_dtype(dtype) and isinstance(dtype, np.dtype) and float_dtype is not None:
+            columns[col] = values.astype(float_dtype)
+        elif pd.api.types.is_string_dtype(dtype) or dtype == object:
+            columns[col] = values.astype('category')
+        else:
+            columns[col] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def dates(df, col='date'):
+    """
+    날짜 열을 DatetimeIndex로. 압축된 프레임(int32 일 오프셋)이든 원래 날짜/문자열 열이든 같은 결과
+    """
+    values = df[col]
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return pd.DatetimeIndex(EPOCH + values.to_numpy().astype('timedelta64[D]'))
+    return pd.DatetimeIndex(pd.to_datetime(values))
+
+
+def memory_bytes(df):
+    """인덱스와 문자열 내용까지 포함한 실제 메모리 사용량"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def memory_report(frames):
+    """
+    frames: {이름: (압축 전, 압축 후)} → 표 문자열.
+    프레임별 전/후 크기와 배율 (TARGET_RATIO에 못 미치면 표시), 마지막 줄에 합계
+    """
+    lines = [f"{'데이터셋':<28}{'행':>10}{'전':>12}{'후':>12}{'배율':>8}"]
+    total_before = total_after = 0
+    for name, (before, after) in frames.items():
+        size_before, size_after = memory_bytes(before), memory_bytes(after)
+        total_before += size_before
+        total_after += size_after
+        lines.append(f"{name:<28}{len(before):>10,}{_human(size_before):>12}{_human(size_after):>12}"
+                     f"{_ratio(size_before, size_after)}")
+    lines.append(f"{'합계':<28}{'':>10}{_human(total_before):>12}{_human(total_after):>12}"
+                 f"{_ratio(total_before, total_after)}")
+    return '\n'.join(lines)
+
+
+def _ratio(before, after):
+    ratio = before / max(after, 1)
+    mark = '' if ratio >= TARGET_RATIO else f'  (목표 {TARGET_RATIO:.0f}x 미달)'
+    return f"{ratio:>7.1f}x{mark}"
+
+
+def _human(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def _report_frames(n_countries):
+    """리포트에 쓰는 데이터셋 (압축 전은 CSV/저장소에서 기본 타입 그대로 읽은 값)"""
+    timeline = store.read_dataset('timeline')
+    if timeline is None:
+        timeline = synthetic.generate_timeline()
+    frames = {
+        'timeline': timeline,
+        f'countries (일별, {n_countries}개국)': synthetic.generate_countries(n_countries),
+    }
+    if os.path.exists(KAGGLE_CSV):
+        frames['country_wise_latest.csv'] = pd.read_csv(KAGGLE_CSV)
+    compacted = {name: compact_frame(df) for name, df in frames.items()}
+    if 'country_wise_latest.csv' in frames:
+        # kaggle_data.load와 같이 비율(float)은 그대로 둔 결과로 측정
+        compacted['country_wise_latest.csv'] = compact_frame(frames['country_wise_latest.csv'], float_dtype=None)
+    return {name: (df, compacted[name]) for name, df in frames.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='데이터셋별 압축 전/후 메모리 리포트')
+    parser.add_argument('--countries', type=int, default=190, help='일별 국가 데이터의 국가 수 (합성 데이터)')
+    args = parser.parse_args()
+    print(memory_report(_report_frames(args.countries)))
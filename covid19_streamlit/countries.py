@@ -0,0 +1,119 @@
+# countries.py 국가 이름 해석 인덱스 (영문/JHU·Kaggle 표기/WHO 공식명/한국어 이름/ISO-3 → 정수 ID)
+#
+# 국가 목록은 data/country_aliases.csv 한 파일에서 관리함 (iso3, name, korean, aliases).
+# ID는 파일의 행 번호라서, 새 국가는 맨 끝에 추가해야 기존 ID가 바뀌지 않음
+
+import functools
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ALIASES_CSV = os.path.join(BASE_DIR, 'data', 'country_aliases.csv')
+
+# 찾지 못한 국가의 ID
+UNKNOWN = -1
+
+
+def normalize(name):
+    """
+    비교용 키. 대소문자, 악센트, 앞뒤/중복 공백, JHU 표기의 '*' 같은 기호 차이를 없앰.
+    ("Côte d’Ivoire" == "cote d'ivoire", "Taiwan*" == "taiwan")
+    """
+    text = unicodedata.normalize('NFKD', str(name))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.replace('’', "'").replace('*', '')
+    return re.sub(r'\s+', ' ', text).strip().casefold()
+
+
+class CountryIndex:
+    """
+    모든 표기를 정규화한 키 → ID 딕셔너리 하나로 조회 (국가 하나 O(1)).
+    열 단위 변환은 고유값만 조회해서 펼치므로 행 수가 아니라 국가 수만큼만 문자열을 다룸
+    """
+
+    def __init__(self, table):
+        self.iso3 = table['iso3'].tolist()
+        self.names = table['name'].tolist()
+        self.korean = table['korean'].tolist()
+        self._lookup = {}
+        for country_id, row in enumerate(table.itertuples(index=False)):
+            aliases = row.aliases.split('|') if row.aliases else []
+            for key in [row.iso3, row.name, row.korean, *aliases]:
+                key = normalize(key)
+                if self._lookup.setdefault(key, country_id) != country_id:
+                    raise ValueError(f"국가 표기 '{key}'가 여러 국가에 등록돼 있습니다")
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return normalize(name) in self._lookup
+
+    def resolve(self, name, default=UNKNOWN):
+        """이름/별칭/ISO-3 코드 → 국가 ID (없으면 default)"""
+        return self._lookup.get(normalize(name), default)
+
+    def id_of(self, name):
+        """resolve와 같지만 없으면 KeyError"""
+        country_id = self.resolve(name)
+        if country_id == UNKNOWN:
+            raise KeyError(f"알 수 없는 국가: {name}")
+        return country_id
+
+    def name_of(self, country_id):
+        return self.names[country_id]
+
+    def korean_of(self, country_id):
+        return self.korean[country_id]
+
+    def iso3_of(self, country_id):
+        return self.iso3[country_id]
+
+    def display(self, name):
+        """화면 표시용 한국어 이름 (모르는 국가는 받은 이름 그대로)"""
+        country_id = self.resolve(name)
+        return name if country_id == UNKNOWN else self.korean[country_id]
+
+    def ids(self, values):
+        """
+        국가 이름 열 → ID 배열 (int32, 모르는 국가는 UNKNOWN).
+        category 열이면 카테고리만, 아니면 고유값만 조회한 뒤 코드로 펼침
+        """
+        if isinstance(values, pd.Series) and isinstance(values.dtype, pd.CategoricalDtype):
+            categories, codes = values.cat.categories, values.cat.codes.to_numpy()
+        else:
+            codes, categories = pd.factorize(np.asarray(values, dtype=object))
+        lookup = np.array([self.resolve(name) for name in categories] + [UNKNOWN], dtype=np.int32)
+        # 결측값 코드(-1)는 맨 끝의 UNKNOWN을 가리킴
+        return lookup[codes]
+
+    def positions(self, values):
+        """
+        국가 이름 열 → {국가 ID: 첫 행 위치}. 같은 표에서 여러 국가를 찾을 때 한 번만 만들어 씀.
+        np.unique의 첫 등장 위치를 쓰므로 행 수가 아니라 국가 수만큼만 파이썬 객체를 만듦
+        """
+        country_ids, first = np.unique(self.ids(values), return_index=True)
+        known = country_ids != UNKNOWN
+        return dict(zip(country_ids[known].tolist(), first[known].tolist()))
+
+    def join(self, left, right, left_on, right_on, how='inner'):
+        """
+        표기가 서로 다른 두 표를 국가 ID로 조인 ("Korea, South" ↔ "Republic of Korea").
+        결과에는 country_id 컬럼이 붙음
+        """
+        left = left.assign(country_id=self.ids(left[left_on]))
+        right = right.assign(country_id=self.ids(right[right_on]))
+        right = right[right['country_id'] != UNKNOWN]
+        return left.merge(right, on='country_id', how=how, suffixes=('', '_right'))
+
+
+@functools.lru_cache(maxsize=None)
+def load_index(path=ALIASES_CSV):
+    """CSV를 읽어서 만든 인덱스 (프로세스당 한 번)"""
+    # 'NA' 같은 코드가 결측값으로 읽히지 않게 기본 결측값 처리를 끔
+    table = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8')
+    return CountryIndex(table)
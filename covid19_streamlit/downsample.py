@@ -0,0 +1,97 @@
+# downsample.py 시계열 차트용 LTTB(Largest-Triangle-Three-Buckets) 다운샘플링
+
+import numpy as np
+import pandas as pd
+
+# 차트 하나에 보내는 점 개수 (가로 픽셀 수 정도면 충분)
+DEFAULT_POINTS = 800
+
+
+def _as_float(x):
+    """날짜/숫자 배열을 면적 계산용 float64로 (날짜는 나노초 정수)"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out=DEFAULT_POINTS):
+    """
+    LTTB로 남길 점의 인덱스.
+    y가 (시리즈 수 × 점 수) 2차원이면 x를 공유하는 모든 시리즈를 한 번에 처리해서 (시리즈 수 × n_out) 반환.
+    첫 점과 마지막 점은 항상 남기고, 나머지 버킷마다 이전 선택 점/다음 버킷 평균과 삼각형 면적이 가장 큰 점을 고름
+    """
+    xf = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+    single = y.ndim == 1
+    ys = y[np.newaxis, :] if single else y
+    n = ys.shape[1]
+
+    if n_out >= n or n_out < 3:
+        idx = np.broadcast_to(np.arange(n), ys.shape).copy()
+        return idx[0] if single else idx
+
+    # 버킷 경계: 첫/마지막 점을 뺀 n - 2개를 n_out - 2개 버킷으로 나눔
+    bounds = (np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(np.int64) + 1
+    bounds[-1] = n - 1
+    starts, ends = bounds[:-1], bounds[1:]
+
+    # 다음 버킷 평균은 선택 결과와 무관하므로 누적합으로 미리 한 번에 계산
+    next_starts = np.append(starts[1:], n - 1)
+    next_ends = np.append(ends[1:], n)
+    cx = np.concatenate(([0.0], np.cumsum(xf)))
+    cy = np.concatenate((np.zeros((len(ys), 1)), np.cumsum(ys, axis=1)), axis=1)
+    counts = next_ends - next_starts
+    avg_x = (cx[next_ends] - cx[next_starts]) / counts
+    avg_y = (cy[:, next_ends] - cy[:, next_starts]) / counts
+
+    rows = np.arange(len(ys))
+    out = np.empty((len(ys), n_out), dtype=np.int64)
+    out[:, 0] = 0
+    out[:, -1] = n - 1
+    prev = np.zeros(len(ys), dtype=np.int64)
+    # 버킷 사이에는 의존성이 있어서 버킷 단위로 돌지만, 버킷 안의 점과 시리즈는 벡터 연산
+    for b in range(n_out - 2):
+        s, e = starts[b], ends[b]
+        px = xf[prev][:, np.newaxis]
+        py = ys[rows, prev][:, np.newaxis]
+        area = np.abs(
+            (px - avg_x[b]) * (ys[:, s:e] - py)
+            - (px - xf[s:e]) * (avg_y[:, b:b + 1] - py)
+        )
+        prev = s + np.argmax(area, axis=1)
+        out[:, b + 1] = prev
+    return out[0] if single else out
+
+
+def lttb(x, y, n_out=DEFAULT_POINTS):
+    """
+    (x, y)를 n_out개 점으로 줄여서 반환. 원본 타입(날짜 등)은 유지.
+    y가 2차원이면 x도 시리즈마다 다른 (시리즈 수 × n_out) 배열로 반환
+    """
+    idx = lttb_indices(x, y, n_out)
+    y = np.asarray(y)
+    if y.ndim == 1:
+        return np.asarray(x)[idx], y[idx]
+    return np.asarray(x)[idx], np.take_along_axis(y, idx, axis=1)
+
+
+def window(x, start=None, end=None):
+    """x가 [start, end] 안에 드는 구간의 slice (x는 오름차순)"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        start = None if start is None else np.datetime64(pd.Timestamp(start))
+        end = None if end is None else np.datetime64(pd.Timestamp(end))
+    lo = 0 if start is None else int(np.searchsorted(x, start, side='left'))
+    hi = len(x) if end is None else int(np.searchsorted(x, end, side='right'))
+    return slice(lo, hi)
+
+
+def lttb_range(x, y, start=None, end=None, n_out=DEFAULT_POINTS):
+    """
+    확대한 구간만 원본 해상도에서 다시 다운샘플링.
+    기간이 짧아질수록 남는 점이 원본에 가까워짐
+    """
+    sl = window(x, start, end)
+    y = np.asarray(y)
+    return lttb(np.asarray(x)[sl], y[..., sl], n_out)
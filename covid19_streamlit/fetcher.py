@@ -0,0 +1,141 @@
+# fetcher.py 원격 데이터 병렬 다운로드 (커넥션 풀 재사용 + 재시도)
+
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import circuit
+import http_cache
+import store
+
+DISEASE_SH_URL = "https://disease.sh/v3/covid-19"
+
+# 동시에 열 수 있는 최대 연결 수 (disease.sh 요청 제한을 고려해서 너무 크게 잡지 않음)
+MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class Source:
+    """원격 데이터 소스 하나 (이름, URL, 소스별 타임아웃/재시도 횟수)"""
+    name: str
+    url: str
+    timeout: float = 5.0
+    retries: int = 2
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """프로세스 전체에서 공유하는 keep-alive 세션 (호스트별 커넥션 풀)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def fetch(source, session=None, use_cache=True):
+    """
+    소스 하나 다운로드 후 응답 본문(bytes) 반환.
+    디스크 캐시에 있으면 조건부 요청으로 재검증하고, 304면 캐시된 본문을 그대로 사용.
+    실패하면 지수 백오프(0.5s, 1s, ...)로 재시도하고, 마지막 예외를 그대로 올림.
+    업스트림 서킷이 열려 있으면 네트워크를 쓰지 않고 바로 CircuitOpenError
+    """
+    breaker = circuit.get_breaker(urlparse(source.url).netloc)
+    if not breaker.allow():
+        raise circuit.CircuitOpenError(f"{breaker.name}: 서킷 차단 중")
+
+    session = session or get_session()
+    cached = http_cache.lookup(source.url) if use_cache else None
+    headers = http_cache.conditional_headers(cached)
+
+    for attempt in range(source.retries + 1):
+        try:
+            response = session.get(source.url, timeout=source.timeout, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                http_cache.touch(source.url)
+                breaker.record_success()
+                return cached['body']
+            response.raise_for_status()
+            breaker.record_success()
+            if use_cache:
+                http_cache.save(source.url, response.content, response.headers)
+            return response.content
+        except requests.RequestException as e:
+            # 4xx는 다시 요청해도 결과가 같으므로 바로 실패 처리 (업스트림 자체는 살아 있음)
+            client_error = e.response is not None and e.response.status_code < 500
+            if client_error:
+                breaker.record_success()
+                raise
+            if attempt == source.retries:
+                breaker.record_failure(e)
+                raise
+            time.sleep(0.5 * 2 ** attempt + random.uniform(0, 0.1))
+
+
+def fetch_all(sources, max_workers=MAX_WORKERS):
+    """
+    여러 소스를 스레드 풀에서 동시에 다운로드.
+    반환값: (results, errors) - 각각 {소스 이름: bytes}, {소스 이름: 예외}
+    전체 소요 시간은 가장 느린 소스 하나에 맞춰짐
+    """
+    results, errors = {}, {}
+    if not sources:
+        return results, errors
+
+    session = get_session()
+    workers = max(1, min(max_workers, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as pool:
+        futures = {source.name: pool.submit(fetch, source, session) for source in sources}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+    return results, errors
+
+
+def github_sources():
+    """load_covid_data가 쓰는 GitHub CSV 소스"""
+    return [
+        Source('timeline', store.REMOTE_BASE_URL + "timeline.csv"),
+        Source('cities', store.REMOTE_BASE_URL + "cities.csv"),
+    ]
+
+
+def historical_all_source(lastdays=30):
+    """disease.sh 전 세계 누적 타임라인"""
+    return Source('historical_all', f"{DISEASE_SH_URL}/historical/all?lastdays={lastdays}", timeout=2, retries=1)
+
+
+def country_history_sources(countries, lastdays='all'):
+    """disease.sh 국가별 타임라인 (국가 수만큼 소스 생성, fetch_all로 병렬 수집)"""
+    return [
+        Source(f"historical:{country}",
+               f"{DISEASE_SH_URL}/historical/{requests.utils.quote(country)}?lastdays={lastdays}",
+               timeout=10)
+        for country in countries
+    ]
+
+
+def fetch_country_histories(countries, lastdays='all', max_workers=MAX_WORKERS):
+    """
+    국가별 타임라인을 병렬로 받아서 {국가: JSON} 반환.
+    실패한 국가는 errors에 모아서 같이 돌려줌 (일부 실패해도 나머지는 사용)
+    """
+    results, errors = fetch_all(country_history_sources(countries, lastdays), max_workers)
+    histories = {name.split(':', 1)[1]: json.loads(body) for name, body in results.items()}
+    return histories, {name.split(':', 1)[1]: e for name, e in errors.items()}
@@ -0,0 +1,77 @@
+# figspec.py go.Figure 검증 없이 Plotly 차트 스펙(dict)을 바로 만드는 빌더 (공통 다크 테마 포함)
+
+import copy
+import os
+
+import pandas as pd
+import plotly.graph_objects as go
+
+# FIGSPEC_VALIDATE=1 이면 모든 스펙을 go.Figure로 검증 (개발 중 속성 이름 오타 확인용)
+VALIDATE = os.environ.get('FIGSPEC_VALIDATE') == '1'
+
+# 대시보드 공통 다크 테마. figure()가 차트별 layout 아래에 한 번 깔아 줌
+DARK_THEME = {
+    'plot_bgcolor': '#1e293b',
+    'paper_bgcolor': '#1e293b',
+    'font': {'color': '#cbd5e1', 'family': 'Noto Sans KR'},
+    'xaxis': {'gridcolor': '#334155'},
+    'yaxis': {'gridcolor': '#334155'},
+}
+
+
+def _plain(value):
+    """pandas 객체는 NumPy 배열로 (직렬화할 때 리스트 변환 없이 처리됨), dict는 안쪽까지"""
+    if isinstance(value, (pd.Series, pd.Index)):
+        return value.to_numpy()
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def merge(base, override):
+    """중첩 dict 병합 (override 우선). base는 바꾸지 않음"""
+    result = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def trace(trace_type, **props):
+    """트레이스 dict. props는 Plotly 속성 이름 그대로 (marker_color 같은 밑줄 축약은 지원하지 않음)"""
+    spec = {'type': trace_type}
+    spec.update(_plain(props))
+    return spec
+
+
+def scatter(**props):
+    return trace('scatter', **props)
+
+
+def scattergl(**props):
+    return trace('scattergl', **props)
+
+
+def bar(**props):
+    return trace('bar', **props)
+
+
+def scatterpolar(**props):
+    return trace('scatterpolar', **props)
+
+
+def figure(data, layout=None, theme=DARK_THEME, validate=None):
+    """
+    {'data': [...], 'layout': {...}} 스펙. layout은 theme 위에 덮어씀.
+    validate=True(또는 FIGSPEC_VALIDATE=1)면 go.Figure로 검증해서 잘못된 속성이 있으면 ValueError
+    """
+    spec = {
+        'data': list(data),
+        'layout': merge(theme, _plain(layout or {})) if theme else _plain(layout or {}),
+    }
+    if VALIDATE if validate is None else validate:
+        go.Figure(spec)
+    return spec
+
@@ -0,0 +1,115 @@
+# figure_cache.py Plotly 차트 캐시 (데이터 버전 × 테마별로 한 번만 만들고 만든 스펙을 재사용)
+
+import sys
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+import serialization
+
+# 캐시에 보관하는 스펙(dict)의 총 메모리 상한 (바이트)
+MAX_BYTES = 64 * 1024 * 1024
+
+
+def _deep_size(obj):
+    """JSON 기본 타입(dict/list/str/숫자)으로 된 객체가 실제로 차지하는 메모리 (바이트)"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sys.getsizeof(k) + _deep_size(v) for k, v in obj.items())
+    elif isinstance(obj, list):
+        size += sum(_deep_size(v) for v in obj)
+    return size
+
+
+class CachedFigure(go.Figure):
+    """
+    이미 만들어 둔 스펙(JSON 기본 타입 dict)을 그대로 내주는 Figure.
+    st.plotly_chart는 Figure 객체면 검증을 건너뛰고 to_dict()만 부르므로, 재실행 때 검증/변환 비용이 없음.
+    스펙은 dict 한 벌만 보관하고 JSON 문자열은 요청할 때 만듦
+    """
+
+    def __init__(self, spec):
+        super().__init__()
+        # BaseFigure는 밑줄로 시작하지 않는 속성을 막으므로 _ 접두어 사용
+        self._spec = spec
+        # 캐시 상한 계산용. dict가 실제로 차지하는 크기 (직렬화된 길이보다 몇 배 큼)
+        self._nbytes = _deep_size(spec)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def to_dict(self):
+        return self._spec
+
+    def to_plotly_json(self):
+        return self._spec
+
+    def to_json(self, *args, **kwargs):
+        return serialization.dumps(self._spec)
+
+
+class FigureCache:
+    """
+    (차트 이름, 데이터 버전, 테마, 파라미터) 키로 CachedFigure를 보관.
+    프로세스 안의 모든 세션이 공유하고, 스펙 크기 합이 max_bytes를 넘으면 가장 오래 쓰지 않은 것부터 버림
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def figure(self, name, data_version, theme, builder, params=()):
+        """
+        캐시에 있으면 그대로 반환, 없으면 builder()로 go.Figure나 figspec 스펙(dict)을 만들어 직렬화한 뒤 저장.
+        정적인 차트는 data_version에 None을 넘기면 됨. params는 해시 가능한 값이어야 함 (튜플 등)
+        """
+        key = (name, data_version, theme, params)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # 만들고 검증하는 동안에는 잠금을 풀어서 다른 차트 요청을 막지 않음
+        fig = builder()
+        spec = fig.to_dict() if isinstance(fig, go.Figure) else fig
+        # 한 번 직렬화했다가 읽어서 배열/NumPy 값을 JSON 기본 타입으로 바꿈 (다시 직렬화해도 빠름)
+        cached = CachedFigure(serialization.loads(serialization.dumps_bytes(spec)))
+        size = cached.nbytes
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = cached
+            self._bytes += size
+            # 방금 넣은 항목 하나는 상한을 넘어도 남겨 둠
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+        return cached
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes': self._bytes,
+            }
+
+
+# 앱 전체에서 쓰는 기본 캐시
+cache = FigureCache()
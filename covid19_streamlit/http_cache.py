@@ -0,0 +1,125 @@
+# http_cache.py 디스크 HTTP 응답 캐시 (ETag/Last-Modified 조건부 재검증)
+
+import hashlib
+import json
+import os
+import time
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'http_cache')
+
+# 캐시 전체 크기 상한. 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+MAX_BYTES = 200 * 1024 * 1024
+
+
+def _paths(url):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    base = os.path.join(CACHE_DIR, key)
+    return base + '.json', base + '.body'
+
+
+def _write_atomic(path, data, mode='wb'):
+    # 여러 워커 프로세스가 같은 URL을 동시에 쓰더라도 반쯤 쓰인 파일을 읽지 않도록 교체 방식 사용
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, mode) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def lookup(url):
+    """캐시된 응답 반환 ({'etag', 'last_modified', 'body', ...}). 없으면 None"""
+    meta_path, body_path = _paths(url)
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            entry = json.load(f)
+        with open(body_path, 'rb') as f:
+            entry['body'] = f.read()
+    except (OSError, ValueError):
+        return None
+    if entry.get('url') != url or len(entry['body']) != entry.get('size'):
+        return None
+    return entry
+
+
+def conditional_headers(entry):
+    """재검증 요청 헤더 (If-None-Match / If-Modified-Since)"""
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def touch(url):
+    """304 응답 등으로 재사용했을 때 최근 사용 시각 갱신 (LRU 순서)"""
+    meta_path, _ = _paths(url)
+    try:
+        os.utime(meta_path)
+    except OSError:
+        pass
+
+
+def save(url, body, headers):
+    """
+    응답 저장. 재검증에 쓸 ETag/Last-Modified가 없는 응답은 저장하지 않음
+    """
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return False
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    meta_path, body_path = _paths(url)
+    meta = {
+        'url': url,
+        'etag': etag,
+        'last_modified': last_modified,
+        'size': len(body),
+        'stored_at': time.time(),
+    }
+    try:
+        # 본문을 먼저 쓰고 메타를 나중에 써서, 메타가 보이면 본문도 완성된 상태가 되게 함
+        _write_atomic(body_path, body)
+        _write_atomic(meta_path, json.dumps(meta), mode='w')
+    except OSError as e:
+        print(f"[http_cache] 저장 실패: {e}")
+        return False
+
+    evict()
+    return True
+
+
+def evict(max_bytes=MAX_BYTES):
+    """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제"""
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+
+    entries = []
+    total = 0
+    for name in names:
+        if not name.endswith('.json'):
+            continue
+        meta_path = os.path.join(CACHE_DIR, name)
+        body_path = meta_path[:-len('.json')] + '.body'
+        try:
+            used_at = os.path.getmtime(meta_path)
+            size = os.path.getsize(body_path)
+        except OSError:
+            continue
+        entries.append((used_at, size, meta_path, body_path))
+        total += size
+
+    entries.sort()
+    for _, size, meta_path, body_path in entries:
+        if total <= max_bytes:
+            break
+        for path in (meta_path, body_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
@@ -0,0 +1,207 @@
+# ingest.py 누적 타임라인을 전체 재적재 대신 새 날짜만 받아서 저장소에 추가하는 증분 적재
+#
+# 소스별로 마지막으로 적재한 날짜와 그날의 누적값, 마지막 확인일을 data/store/ingest_state.json에 기록해 두고,
+#   1) 그 날짜 이후만 요청 (disease.sh는 lastdays=N)
+#   2) 겹치는 마지막 날의 값이 저장된 값과 같은지, 새 누적값이 줄지 않는지 검증
+#   3) 새 행만 store.append_dataset으로 추가
+# 차트 캐시는 range_version으로 추가된 날짜 범위와 겹치는 기간만 다시 만듦
+#
+#   python ingest.py   # disease.sh 전 세계 타임라인 증분 적재
+
+import json
+import os
+from collections import namedtuple
+from datetime import date, datetime
+
+import pandas as pd
+
+import fetcher
+import store
+
+STATE_PATH = os.path.join(store.STORE_DIR, 'ingest_state.json')
+
+# 누적값 검증 대상 컬럼
+CUMULATIVE_COLUMNS = ('cases', 'deaths')
+
+# 적재 결과. start/end는 새로 추가된 날짜 범위 (ISO 문자열), rows는 추가된 행 수
+IngestResult = namedtuple('IngestResult', ['name', 'start', 'end', 'rows'])
+
+
+class IngestError(Exception):
+    """새 데이터가 저장된 누적값과 맞지 않음 (원본이 과거 값을 고쳤거나 날짜가 빠짐)"""
+
+
+def load_state():
+    """{소스 이름: {'last_date', 'cases', 'deaths', 'checked_at'}}"""
+    try:
+        with open(STATE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state):
+    # store.locked() 안에서 저장소 갱신과 같이 호출해서 저장소와 상태가 어긋나지 않게 함
+    store.write_json(STATE_PATH, state)
+
+
+def _last_row_state(df):
+    last = df.iloc[-1]
+    return {
+        'last_date': pd.Timestamp(last['date']).strftime('%Y-%m-%d'),
+        **{col: int(last[col]) for col in CUMULATIVE_COLUMNS},
+    }
+
+
+def validate(df, previous):
+    """
+    새로 받은 행(df, 날짜순) 검증. previous는 마지막으로 적재한 날의 상태 (없으면 None).
+    반환: previous 이후의 새 행만. 맞지 않으면 IngestError
+    """
+    dates = pd.DatetimeIndex(pd.to_datetime(df['date']))
+    if not dates.is_monotonic_increasing or dates.has_duplicates:
+        raise IngestError("날짜가 오름차순이 아니거나 중복됨")
+    for col in CUMULATIVE_COLUMNS:
+        if (df[col].diff().dropna() < 0).any():
+            raise IngestError(f"{col} 누적값이 줄어든 날이 있음")
+    if previous is None:
+        return df
+
+    last_date = pd.Timestamp(previous['last_date'])
+    overlap = df[dates == last_date]
+    if overlap.empty:
+        # 겹치는 날이 없으면 사이에 빠진 날이 있는지 확인할 수 없음
+        if len(dates) == 0 or dates[0] > last_date + pd.Timedelta(days=1):
+            raise IngestError(f"{previous['last_date']} 이후 날짜가 이어지지 않음")
+    else:
+        for col in CUMULATIVE_COLUMNS:
+            if int(overlap[col].iloc[0]) != previous[col]:
+                raise IngestError(f"{previous['last_date']}의 {col}가 저장된 값과 다름 "
+                                  f"({previous[col]} → {int(overlap[col].iloc[0])})")
+
+    new_rows = df[dates > last_date]
+    for col in CUMULATIVE_COLUMNS:
+        if len(new_rows) and int(new_rows[col].iloc[0]) < previous[col]:
+            raise IngestError(f"새 {col} 누적값이 저장된 값보다 작음")
+    return new_rows
+
+
+def ingest_frame(name, df):
+    """
+    받아 온 (date, cases, deaths) 데이터프레임에서 마지막 적재일 이후 행만 저장소에 추가.
+    처음이면 전체를 씀. 새 행이 없으면(빈 응답 포함) None, 검증에 실패하면 IngestError (저장소는 그대로)
+    """
+    if df.empty:
+        return None
+    df = store.coerce(df, name).sort_values('date').reset_index(drop=True)
+    # 상태 읽기 → 검증 → 저장소 추가 → 상태 저장을 한 잠금 안에서 (다른 워커의 적재와 섞이지 않게)
+    with store.locked():
+        state = load_state()
+        previous = state.get(name)
+        if previous is not None and store.dataset_version(name) is None:
+            # 저장소가 지워졌으면 처음부터
+            previous = None
+
+        new_rows = validate(df, previous)
+        if new_rows.empty:
+            return None
+        if previous is None:
+            store.write_dataset(name, new_rows)
+        else:
+            store.append_dataset(name, new_rows)
+
+        state[name] = _last_row_state(new_rows)
+        _save_state(state)
+    return IngestResult(name, pd.Timestamp(new_rows['date'].iloc[0]).strftime('%Y-%m-%d'),
+                        state[name]['last_date'], len(new_rows))
+
+
+def replace(name, df):
+    """검증에 실패했을 때 전체를 새로 씀 (원본이 과거 값을 고친 경우). 빈 데이터면 IngestError (저장소는 그대로)"""
+    if df.empty:
+        raise IngestError("빈 데이터로 전체를 바꿀 수 없음")
+    df = store.coerce(df, name).sort_values('date').reset_index(drop=True)
+    with store.locked():
+        store.write_dataset(name, df)
+        state = load_state()
+        state[name] = _last_row_state(df)
+        _save_state(state)
+    return IngestResult(name, pd.Timestamp(df['date'].iloc[0]).strftime('%Y-%m-%d'),
+                        state[name]['last_date'], len(df))
+
+
+def parse_disease_sh(body):
+    """disease.sh historical 응답 ({'cases': {'1/22/20': n}, 'deaths': {...}}) → 데이터프레임"""
+    data = json.loads(body)
+    timeline = data.get('timeline', data)
+    cases = pd.Series(timeline['cases'], dtype='int64')
+    deaths = pd.Series(timeline['deaths'], dtype='int64')
+    return pd.DataFrame({
+        'date': pd.to_datetime(cases.index, format='%m/%d/%y'),
+        'cases': cases.to_numpy(),
+        'deaths': deaths.reindex(cases.index).fillna(0).astype('int64').to_numpy(),
+    })
+
+
+def lastdays_since(previous, today=None):
+    """
+    disease.sh lastdays 값. 처음이면 'all'.
+    lastdays는 원본의 최신 날짜부터 거꾸로 세므로, 지난 확인 이후 지난 날수 + 1이면 마지막 적재일이
+    항상 포함됨 (원본이 갱신을 멈췄어도 매번 전체 기간을 다시 받지 않음)
+    """
+    if previous is None:
+        return 'all'
+    today = today or date.today()
+    since = previous.get('checked_at', previous['last_date'])
+    return max(1, (today - datetime.strptime(since, '%Y-%m-%d').date()).days + 1)
+
+
+def _mark_checked(name, today=None):
+    with store.locked():
+        state = load_state()
+        if name in state:
+            state[name]['checked_at'] = (today or date.today()).isoformat()
+            _save_state(state)
+
+
+def ingest_disease_sh(name='historical_all'):
+    """
+    disease.sh 전 세계 타임라인 증분 적재. 원본이 과거 값을 고쳤으면 전체를 다시 받아서 새로 씀.
+    반환: IngestResult (새 날짜가 없으면 None)
+    """
+    previous = load_state().get(name) if store.dataset_version(name) is not None else None
+    lastdays = lastdays_since(previous)
+    df = parse_disease_sh(fetcher.fetch(fetcher.historical_all_source(lastdays=lastdays)))
+    try:
+        result = ingest_frame(name, df)
+    except IngestError as e:
+        print(f"[ingest] {name}: {e}, 전체 다시 적재")
+        full = df if lastdays == 'all' else parse_disease_sh(fetcher.fetch(fetcher.historical_all_source(lastdays='all')))
+        result = replace(name, full)
+    _mark_checked(name)
+    return result
+
+
+def range_version(revisions, start, end):
+    """
+    기간 [start, end]의 데이터를 마지막으로 바꾼 저장소 버전 (차트 캐시 키 용도).
+    revisions는 store.dataset_revisions 결과. 이 기간과 겹치지 않는 추가분은 무시하므로
+    하루치가 추가돼도 과거 기간 차트는 캐시를 그대로 씀. 이력이 없으면 None
+    """
+    if not revisions:
+        return None
+    start = start.isoformat() if start is not None else None
+    end = end.isoformat() if end is not None else None
+    version = revisions[0]['version']
+    for revision in revisions[1:]:
+        if (end is None or revision['start'] <= end) and (start is None or revision['end'] >= start):
+            version = revision['version']
+    return version
+
+
+if __name__ == "__main__":
+    result = ingest_disease_sh()
+    if result is None:
+        print("새 날짜 없음")
+    else:
+        print(f"{result.name}: {result.start} ~ {result.end} ({result.rows}행) 추가")
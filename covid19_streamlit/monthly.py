@@ -0,0 +1,72 @@
+# monthly.py 국가별 월간 데이터(covid19_monthly_cases_by_country.csv)를 국가 × 월 행렬로 변환
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+import series
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MONTHLY_CSV = os.path.join(BASE_DIR, 'data', 'covid19_monthly_cases_by_country.csv')
+
+# 정적 사이트(COVID19/)가 읽는 사전 계산 JSON
+STATIC_JSON = os.path.join(BASE_DIR, '..', 'COVID19', 'data', 'covid19_monthly_matrix.json')
+
+# 보기 이름 → CSV 컬럼
+VIEWS = {
+    'cumulative': 'Cumulative_cases',
+    'new': 'New_cases',
+    'deaths': 'Cumulative_deaths',
+}
+
+
+def source_mtime(path=MONTHLY_CSV):
+    """캐시 키용 CSV 수정 시각"""
+    return os.path.getmtime(path)
+
+
+def load_monthly(path=MONTHLY_CSV):
+    """
+    CSV를 한 번 읽어서 보기별 CountrySeries(국가 × 월)로 변환.
+    세 보기는 국가/월 인덱스가 같아서 row(국가)로 꺼낸 값의 위치가 서로 맞음
+    """
+    df = pd.read_csv(path, encoding='utf-8-sig', parse_dates=['year_month'])
+    # 신규 확진자는 CSV에 실수로 저장돼 있지만 값은 모두 정수
+    df['New_cases'] = df['New_cases'].fillna(0).astype(np.int64)
+    return {
+        view: series.from_long(df, country_col='Country', date_col='year_month', value_col=column)
+        for view, column in VIEWS.items()
+    }
+
+
+def to_payload(views):
+    """
+    정적 사이트용 dict. 월 라벨과 국가 목록은 한 번만, 값은 보기별 (국가 × 월) 2차원 배열로.
+    브라우저는 rows.find 없이 인덱스로 바로 읽음
+    """
+    first = next(iter(views.values()))
+    return {
+        'months': [d.strftime('%Y-%m') for d in first.dates],
+        'countries': list(first.names),
+        **{view: data.matrix.tolist() for view, data in views.items()},
+    }
+
+
+def export_json(path=STATIC_JSON, source=MONTHLY_CSV):
+    payload = to_payload(load_monthly(source))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    return payload
+
+
+if __name__ == "__main__":
+    # CSV가 바뀌면 다시 실행해서 COVID19/data/covid19_monthly_matrix.json을 갱신
+    parser = argparse.ArgumentParser(description='월간 국가별 데이터를 정적 사이트용 JSON으로 내보내기')
+    parser.add_argument('--output', default=STATIC_JSON)
+    args = parser.parse_args()
+
+    payload = export_json(args.output)
+    print(f"국가 {len(payload['countries'])}개 × 월 {len(payload['months'])}개 -> {os.path.normpath(args.output)}")
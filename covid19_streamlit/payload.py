@@ -0,0 +1,75 @@
+# payload.py 3D 지구본에 넘기는 타임라인 압축 인코딩 (base64 typed array)
+
+import base64
+
+import numpy as np
+import pandas as pd
+
+import compact
+import serialization
+
+# 증가량이 들어가는 가장 작은 정수 타입을 고름 (JS 쪽 TypedArray 이름과 짝)
+INT_TYPES = [('i1', '<i1'), ('i2', '<i2'), ('i4', '<i4')]
+
+
+def _encode_array(values, dtype):
+    """리틀 엔디언 바이트열을 base64 문자열로 (브라우저의 Int32Array/Float64Array가 그대로 읽음)"""
+    return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode('ascii')
+
+
+def _encode_deltas(values):
+    """
+    누적값을 (첫 값, 전날 대비 증가량 배열)로 인코딩.
+    증가량은 Int8/Int16/Int32 중 들어가는 가장 작은 타입, 정수가 아니거나 Int32를 넘으면 Float64
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return {'base': 0, 'dtype': 'i1', 'data': ''}
+    deltas = np.diff(values, prepend=values[0])
+    if np.all(np.isfinite(deltas)) and np.all(deltas == np.round(deltas)):
+        lo, hi = deltas.min(), deltas.max()
+        for name, dtype in INT_TYPES:
+            info = np.iinfo(np.dtype(dtype))
+            if info.min <= lo and hi <= info.max:
+                return {'base': float(values[0]), 'dtype': name, 'data': _encode_array(deltas, dtype)}
+    return {'base': float(values[0]), 'dtype': 'f8', 'data': _encode_array(deltas, '<f8')}
+
+
+def encode_timeline(df, columns=('cases', 'deaths')):
+    """
+    타임라인 데이터프레임(date + 누적 컬럼)을 JSON 문자열로 인코딩.
+    날짜는 시작일 + 일 단위 오프셋(Int32, 하루도 빠짐없이 이어지면 생략), 누적값은 증가량으로 보냄
+    """
+    dates = compact.dates(df).normalize()
+    start = dates[0] if len(dates) else pd.Timestamp('2020-01-01')
+    offsets = ((dates - start) // pd.Timedelta(days=1)).to_numpy()
+
+    contiguous = np.array_equal(offsets, np.arange(len(offsets)))
+    payload = {
+        'start': start.strftime('%Y-%m-%d'),
+        'length': len(dates),
+        'days': None if contiguous else _encode_array(offsets, '<i4'),
+    }
+    for col in columns:
+        payload[col] = _encode_deltas(df[col].to_numpy())
+    return serialization.dumps(payload)
+
+
+# 지구본 스크립트에 같이 넣는 디코더. decodeTimeline(payload) -> {length, date(i), cases, deaths}
+DECODER_JS = """
+function b64ToBuffer(s){const bin=atob(s);const bytes=new Uint8Array(bin.length);for(let i=0;i<bin.length;i++)bytes[i]=bin.charCodeAt(i);return bytes.buffer;}
+const TYPED_ARRAYS={i1:Int8Array,i2:Int16Array,i4:Int32Array,f8:Float64Array};
+function decodeCumulative(col,length){
+const deltas=new TYPED_ARRAYS[col.dtype](b64ToBuffer(col.data));
+const out=new Float64Array(length);let acc=col.base;
+for(let i=0;i<length;i++){acc+=deltas[i];out[i]=acc;}
+return out;
+}
+function decodeTimeline(p){
+const days=p.days?new Int32Array(b64ToBuffer(p.days)):null;
+const startMs=Date.parse(p.start+'T00:00:00Z');
+const t={length:p.length,date:i=>new Date(startMs+(days?days[i]:i)*86400000).toISOString().split('T')[0]};
+Object.keys(p).forEach(k=>{if(p[k]&&p[k].dtype)t[k]=decodeCumulative(p[k],p.length);});
+return t;
+}
+"""
@@ -0,0 +1,65 @@
+# perf.py 섹션(fragment)별 실행 시간 측정과 지연 시간 예산
+
+import functools
+import threading
+import time
+from collections import defaultdict, deque
+
+# 상호작용 한 번에 섹션이 다시 실행될 때 허용하는 시간 (ms)
+LATENCY_BUDGET_MS = {
+    'globe': 50,
+    'analytics': 150,
+    'symptoms': 80,
+    'vaccine': 60,
+    'indepth': 80,
+    'variant_panel': 30,
+}
+DEFAULT_BUDGET_MS = 100
+
+# 섹션별로 최근 측정값 몇 개만 보관
+WINDOW = 200
+
+_samples = defaultdict(lambda: deque(maxlen=WINDOW))
+_lock = threading.Lock()
+
+
+def timed(name):
+    """함수 실행 시간을 기록하고, 예산을 넘으면 로그를 남기는 데코레이터"""
+    budget = LATENCY_BUDGET_MS.get(name, DEFAULT_BUDGET_MS)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with _lock:
+                    _samples[name].append(elapsed_ms)
+                if elapsed_ms > budget:
+                    print(f"[perf] {name}: {elapsed_ms:.1f}ms (예산 {budget}ms 초과)")
+        return wrapper
+    return decorator
+
+
+def stats():
+    """섹션별 {count, last_ms, p50_ms, p95_ms, budget_ms, over_budget}"""
+    with _lock:
+        snapshot = {name: list(samples) for name, samples in _samples.items()}
+
+    result = {}
+    for name, samples in snapshot.items():
+        ordered = sorted(samples)
+        p50 = ordered[len(ordered) // 2]
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        budget = LATENCY_BUDGET_MS.get(name, DEFAULT_BUDGET_MS)
+        result[name] = {
+            'count': len(samples),
+            'last_ms': round(samples[-1], 1),
+            'p50_ms': round(p50, 1),
+            'p95_ms': round(p95, 1),
+            'budget_ms': budget,
+            'over_budget': p95 > budget,
+        }
+    return result
@@ -0,0 +1,111 @@
+# refresher.py 백그라운드 데이터 갱신 (stale-while-revalidate)
+
+import threading
+import time
+from collections import namedtuple
+
+# 기본 갱신 주기 (초)
+REFRESH_INTERVAL = 6 * 60 * 60
+# 갱신 실패 시 다시 시도하기까지 대기 시간 (초)
+RETRY_INTERVAL = 5 * 60
+# 기본(fallback) 데이터로 버티는 중일 때는 더 짧은 주기로 재시도 (초)
+FALLBACK_TTL = 60
+
+# version은 스냅샷이 교체될 때마다 1씩 증가 (캐시 키 용도)
+Snapshot = namedtuple('Snapshot', ['version', 'data', 'loaded_at', 'source'])
+
+
+class DatasetRefresher:
+    """
+    마지막으로 성공한 데이터 스냅샷을 들고 있다가 백그라운드 스레드에서 주기적으로 새로 받아 교체.
+    사용자 요청은 snapshot()으로 현재 스냅샷을 바로 받아가므로 네트워크를 기다리지 않음
+    """
+
+    def __init__(self, name, load_local, load_remote, interval=REFRESH_INTERVAL):
+        self.name = name
+        self._load_remote = load_remote
+        self._interval = interval
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._last_error = None
+
+        # 첫 스냅샷은 로컬(저장소/기본 데이터)에서 바로 만듦
+        data, source = load_local()
+        self._snapshot = Snapshot(1, data, time.time(), source)
+
+        self._thread = threading.Thread(target=self._run, name=f'refresh-{name}', daemon=True)
+        self._thread.start()
+
+    def snapshot(self):
+        """현재 스냅샷 (속성 하나를 읽는 것이라 잠금 없이도 항상 완전한 스냅샷을 받음)"""
+        return self._snapshot
+
+    def status(self):
+        """현재 스냅샷 정보 (화면 표시/모니터링용)"""
+        snapshot = self._snapshot
+        return {
+            'version': snapshot.version,
+            'source': snapshot.source,
+            'age': round(time.time() - snapshot.loaded_at, 1),
+            'last_error': self._last_error,
+        }
+
+    def refresh_now(self):
+        """다음 갱신을 기다리지 않고 바로 갱신 요청"""
+        self._wakeup.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+
+    def _refresh(self):
+        try:
+            data = self._load_remote()
+        except Exception as e:
+            self._last_error = repr(e)
+            print(f"[refresher] {self.name}: 갱신 실패, 이전 스냅샷 유지 ({e})")
+            return False
+        self._last_error = None
+        previous = self._snapshot
+        # 새 스냅샷을 다 만든 뒤 참조 하나만 바꿔 끼움
+        self._snapshot = Snapshot(previous.version + 1, data, time.time(), 'remote')
+        return True
+
+    def _run(self):
+        # 로컬 저장소가 없어서 기본 데이터로 시작했다면 바로 한 번 갱신
+        delay = 0 if self._snapshot.source == 'fallback' else self._interval
+        while not self._stopped:
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            if self._stopped:
+                break
+            if self._refresh():
+                delay = self._interval
+            elif self._snapshot.source == 'fallback':
+                delay = FALLBACK_TTL
+            else:
+                delay = min(RETRY_INTERVAL, self._interval)
+
+
+_refreshers = {}
+_registry_lock = threading.Lock()
+
+
+def get_refresher(name, load_local, load_remote, interval=REFRESH_INTERVAL):
+    """
+    프로세스당 하나의 refresher를 만들어서 재사용.
+    Streamlit은 스크립트를 매번 다시 실행하지만 이 모듈은 한 번만 import되므로 모든 세션이 공유함
+    """
+    with _registry_lock:
+        refresher = _refreshers.get(name)
+        if refresher is None:
+            refresher = DatasetRefresher(name, load_local, load_remote, interval)
+            _refreshers[name] = refresher
+        return refresher
+
+
+def refresher_states():
+    """모든 refresher 상태 {이름: status dict}"""
+    with _registry_lock:
+        refreshers = list(_refreshers.values())
+    return {refresher.name: refresher.status() for refresher in refreshers}
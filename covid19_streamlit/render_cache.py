@@ -0,0 +1,60 @@
+# render_cache.py HTML 컴포넌트 렌더링 결과 캐시 (LRU + 적중/미스 카운터)
+
+import threading
+from collections import OrderedDict
+
+MAX_ENTRIES = 32
+
+
+class RenderCache:
+    """
+    (컴포넌트 이름, 템플릿 버전, 데이터 버전, 파라미터) 키로 완성된 HTML 문자열을 보관.
+    프로세스 안의 모든 세션이 공유하고, 가득 차면 가장 오래 쓰지 않은 항목부터 버림
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, name, template_version, data_version, params, builder):
+        """
+        캐시에 있으면 그대로 반환, 없으면 builder()로 만들어서 저장.
+        params는 해시 가능한 값이어야 함 (튜플 등)
+        """
+        key = (name, template_version, data_version, params)
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        # 만드는 동안에는 잠금을 풀어서 다른 컴포넌트 요청을 막지 않음
+        html = builder()
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes': sum(len(html) for html in self._entries.values()),
+            }
+
+
+# 앱 전체에서 쓰는 기본 캐시
+cache = RenderCache()
@@ -0,0 +1,149 @@
+# serialization.py NumPy/pandas 데이터를 compact JSON으로 바로 쓰는 직렬화 모듈 (orjson, 없으면 json)
+#
+# 규칙 (orjson / json 어느 쪽이든 같은 값. 지수 표기만 다를 수 있음: orjson 1e-7, json 1e-07):
+#   - NaN, inf, NaT → null
+#   - float32/float16 → 그 타입에서 가장 짧은 10진 표기 (float32 0.1 → 0.1, 0.10000000149011612가 아님)
+#   - 날짜/시각 → ISO 8601 문자열 ("2020-01-01T00:00:00", 날짜만 있으면 "2020-01-01")
+#   - NumPy 배열, pandas Series/Index → 리스트, DataFrame → {컬럼: 리스트}
+
+import datetime
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# _convert_datetimes가 더 들여다보지 않는 기본 타입
+_LEAVES = frozenset((str, int, float, bool, type(None)))
+
+
+def _widen_floats(values):
+    """
+    float64보다 좁은 실수 배열 → 같은 10진 표기의 float64 배열.
+    그냥 astype(float64)하면 float32 0.1이 0.10000000149011612가 되므로 문자열(가장 짧은 표기)을 거침
+    """
+    if values.dtype.itemsize >= 8:
+        return values
+    return values.astype(str).astype(np.float64)
+
+
+def _default(obj):
+    """orjson이 직접 못 쓰는 타입을 변환 (배열은 그대로 넘겨서 orjson이 C로 처리)"""
+    if isinstance(obj, pd.DataFrame):
+        return _convert_datetimes({col: obj[col].to_numpy() for col in obj.columns})
+    if isinstance(obj, (pd.Series, pd.Index)):
+        values = obj.to_numpy()
+        return _convert_datetimes(values) if values.dtype != object else values.tolist()
+    if isinstance(obj, pd.Timestamp):
+        return None if pd.isna(obj) else obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        # 문자열 등 object 배열, 정렬되지 않은 배열, orjson이 못 쓰는 float16
+        if np.issubdtype(obj.dtype, np.floating):
+            return _widen_floats(obj)
+        return obj.tolist()
+    if isinstance(obj, np.floating):
+        return float(_widen_floats(np.array([obj]))[0])
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is pd.NaT:
+        return None
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+def _datetime_strings(values):
+    """datetime64 배열 → ISO 문자열 리스트 (NaT는 None). orjson과 같은 초 단위 형식"""
+    strings = np.datetime_as_string(values.astype('datetime64[s]'), unit='s').astype(object)
+    strings[np.isnat(values)] = None
+    return strings.tolist()
+
+
+def _convert_datetimes(obj):
+    """
+    dict/list/tuple 안의 datetime64 값과, NaT가 있거나 연속되지 않은 datetime64 배열을 ISO 문자열(NaT는 None)로 바꿈.
+    orjson은 NaT를 예외 없이 1970-01-01로 쓰거나(datetime64[D]) 프로세스를 죽이므로(datetime64[s]) orjson에 넘기기 전에 거침.
+    NaT가 없는 연속 배열은 orjson이 같은 형식으로 쓰므로 그대로 둠. 바뀐 것이 없으면 원래 객체를 반환
+    """
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind != 'M' or (obj.flags.c_contiguous and not np.isnat(obj).any()):
+            return obj
+        return _datetime_strings(obj)
+    if isinstance(obj, np.datetime64):
+        return _datetime_strings(np.array([obj]))[0]
+    if isinstance(obj, dict):
+        values, items = obj.values(), obj.items()
+    elif isinstance(obj, (list, tuple)):
+        values, items = obj, enumerate(obj)
+    else:
+        return obj
+    # 기본 타입만 든 dict/리스트(도시 레코드, 숫자 리스트)는 C 수준의 타입 확인으로 바로 넘어감
+    if _LEAVES.issuperset(map(type, values)):
+        return obj
+    converted = None
+    for key, value in items:
+        if type(value) not in _LEAVES:
+            new = _convert_datetimes(value)
+            if new is not value:
+                if converted is None:
+                    converted = dict(obj) if isinstance(obj, dict) else list(obj)
+                converted[key] = new
+    return obj if converted is None else converted
+
+
+def to_builtin(obj):
+    """
+    json 모듈로 쓸 수 있는 기본 타입으로 변환 (orjson이 없을 때 사용).
+    배열은 tolist()로 한 번에 바꾸고, NaN만 따로 None으로 바꿈
+    """
+    if isinstance(obj, dict):
+        return {k if isinstance(k, str) else str(k): to_builtin(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_builtin(v) for v in obj]
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        return to_builtin(_default(obj))
+    if isinstance(obj, np.ndarray):
+        if np.issubdtype(obj.dtype, np.datetime64):
+            return _datetime_strings(obj)
+        if np.issubdtype(obj.dtype, np.floating):
+            values = _widen_floats(obj).astype(object)
+            values[~np.isfinite(obj)] = None
+            return values.tolist()
+        return to_builtin(obj.tolist()) if obj.dtype == object else obj.tolist()
+    if isinstance(obj, np.datetime64):
+        return _datetime_strings(np.array([obj]))[0]
+    if isinstance(obj, np.floating):
+        return to_builtin(float(_widen_floats(np.array([obj]))[0]))
+    if isinstance(obj, np.generic):
+        return to_builtin(obj.item())
+    if isinstance(obj, datetime.datetime):
+        return None if pd.isna(obj) else obj.isoformat()
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    return obj
+
+
+def dumps_bytes(obj):
+    """compact JSON (UTF-8 bytes)"""
+    if orjson is not None:
+        return orjson.dumps(_convert_datetimes(obj), default=_default, option=_OPTIONS)
+    return json.dumps(to_builtin(obj), separators=(',', ':'), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+
+def dumps(obj):
+    """compact JSON 문자열 (HTML/JS에 그대로 넣을 수 있음)"""
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,84 @@
+# series.py 국가별 시계열 엔진 (국가 × 날짜 2차원 행렬)
+
+import numpy as np
+import pandas as pd
+
+import downsample
+
+
+class CountrySeries:
+    """
+    모든 국가의 시계열을 (국가 수 × 날짜 수) 행렬 하나로 보관.
+    국가 이름 → 행 번호 딕셔너리가 있어서 국가 하나를 꺼내는 비용은 O(1) (복사 없는 뷰)
+    """
+
+    def __init__(self, names, dates, matrix):
+        matrix = np.asarray(matrix)
+        if matrix.shape != (len(names), len(dates)):
+            raise ValueError(f"행렬 크기 {matrix.shape}가 국가 {len(names)} × 날짜 {len(dates)}와 다릅니다")
+        # 여러 세션이 같은 객체를 공유하므로 실수로 값을 바꾸지 못하게 읽기 전용으로 둠
+        matrix.setflags(write=False)
+
+        self.names = list(names)
+        self.dates = pd.DatetimeIndex(dates)
+        self.matrix = matrix
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self.names)
+
+    def index_of(self, name):
+        return self._index[name]
+
+    def row(self, name):
+        """국가 하나의 시계열 (행렬의 뷰)"""
+        return self.matrix[self._index[name]]
+
+    def rows(self, names):
+        """여러 국가를 한 번에 (names 순서대로 쌓은 행렬)"""
+        return self.matrix[[self._index[name] for name in names]]
+
+    def downsampled(self, names, start=None, end=None, n_out=downsample.DEFAULT_POINTS):
+        """
+        차트용으로 줄인 (날짜, 값) 행렬 (각각 국가 수 × n_out).
+        원본 행렬은 그대로 보관하고, 확대 요청이 오면 그 기간만 원본 해상도에서 다시 샘플링
+        """
+        return downsample.lttb_range(self.dates.values, self.rows(names), start, end, n_out)
+
+    def to_frame(self):
+        """long 형식 데이터프레임 (date, country, value). 내보내기/디버깅용"""
+        return pd.DataFrame({
+            'date': np.tile(self.dates.values, len(self.names)),
+            'country': np.repeat(np.array(self.names, dtype=object), len(self.dates)),
+            'value': self.matrix.ravel(),
+        })
+
+
+def from_multipliers(dates, base, multipliers):
+    """
+    기준 시계열 × 국가별 배율을 브로드캐스팅으로 한 번에 계산.
+    multipliers: {국가: 배율}. 값은 int()와 같게 0 방향으로 버림
+    """
+    weights = np.fromiter(multipliers.values(), dtype=np.float64, count=len(multipliers))
+    base = np.asarray(base, dtype=np.float64)
+    matrix = np.trunc(weights[:, np.newaxis] * base[np.newaxis, :]).astype(np.int64)
+    return CountrySeries(multipliers.keys(), dates, matrix)
+
+
+def from_long(df, country_col='country', date_col='date', value_col='cases'):
+    """
+    long 형식(국가, 날짜, 값) 데이터프레임을 행렬로 변환.
+    날짜가 빠진 칸은 0으로 채움
+    """
+    countries = pd.Categorical(df[country_col])
+    dates = pd.DatetimeIndex(pd.to_datetime(df[date_col]))
+    unique_dates = dates.unique().sort_values()
+
+    row = countries.codes
+    col = unique_dates.get_indexer(dates)
+    matrix = np.zeros((len(countries.categories), len(unique_dates)), dtype=np.int64)
+    matrix[row, col] = df[value_col].to_numpy()
+    return CountrySeries(countries.categories, unique_dates, matrix)
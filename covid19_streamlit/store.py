@@ -0,0 +1,284 @@
+# store.py 로컬 데이터셋 저장소 (Parquet + manifest)
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: 프로세스 간 잠금 없이 스레드 잠금만 씀
+    fcntl = None
+
+# COVID_STORE_DIR로 다른 저장소를 지정할 수 있음 (합성 데이터 부하 테스트 등)
+STORE_DIR = os.environ.get(
+    'COVID_STORE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'store'))
+MANIFEST_PATH = os.path.join(STORE_DIR, 'manifest.json')
+LOCK_PATH = os.path.join(STORE_DIR, '.lock')
+
+REMOTE_BASE_URL = "https://raw.githubusercontent.com/hyoeun979704-web/Covid-19_Project_bive-coding-team/main/COVID19/data/"
+
+# 추가분(part) 파일이 이보다 많아지면 한 파일로 합쳐서 다시 씀 (읽기 비용이 파일 수에 비례하지 않게)
+MAX_PARTS = 30
+
+# 데이터셋별 컬럼 타입 (날짜는 미리 파싱해서 저장)
+SCHEMAS = {
+    'timeline': {
+        'date': 'datetime64',
+        'cases': 'int64',
+        'deaths': 'int64',
+    },
+    'cities': {
+        'name': 'string',
+        'lat': 'float64',
+        'lon': 'float64',
+        'cases': 'int64',
+    },
+    'countries': {
+        'date': 'datetime64',
+        'country': 'string',
+        'cases': 'int64',
+        'deaths': 'int64',
+    },
+    # disease.sh 전 세계 누적 타임라인 (ingest.py가 하루치씩 추가)
+    'historical_all': {
+        'date': 'datetime64',
+        'cases': 'int64',
+        'deaths': 'int64',
+    },
+}
+
+
+def coerce(df, name):
+    """스키마에 맞게 컬럼 타입 변환 (스키마에 없는 컬럼은 그대로 둠)"""
+    df = df.copy()
+    for col, dtype in SCHEMAS[name].items():
+        if col not in df.columns:
+            continue
+        if dtype.startswith('datetime'):
+            df[col] = pd.to_datetime(df[col])
+        elif dtype.startswith('int'):
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+# 프로세스 안 스레드 간 잠금 + 중첩 깊이 (flock은 같은 프로세스에서 다시 잡으면 막히므로 가장 바깥에서만 잡음)
+_thread_lock = threading.RLock()
+_lock_depth = 0
+_lock_file = None
+
+
+@contextlib.contextmanager
+def locked():
+    """
+    저장소 쓰기 잠금. manifest 읽기 → 버전 증가 → 파일 쓰기 → manifest 교체 → 이전 파일 삭제를
+    Streamlit 워커 프로세스/갱신 스레드 사이에서 한 번에 하나만 하도록 함. 중첩해서 써도 됨
+    """
+    global _lock_depth, _lock_file
+    with _thread_lock:
+        if _lock_depth == 0:
+            os.makedirs(STORE_DIR, exist_ok=True)
+            _lock_file = open(LOCK_PATH, 'a')
+            if fcntl is not None:
+                fcntl.flock(_lock_file, fcntl.LOCK_EX)
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+            if _lock_depth == 0:
+                # 파일을 닫으면 flock도 풀림
+                _lock_file.close()
+                _lock_file = None
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_manifest():
+    """manifest.json 읽기. 없으면 빈 manifest 반환"""
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'version': 0, 'datasets': {}}
+
+
+def write_json(path, data):
+    """
+    임시 파일에 쓰고 교체해서 다른 프로세스가 반쯤 쓰인 파일을 읽지 않게 함.
+    임시 파일 이름에 pid를 넣어서 프로세스끼리 같은 임시 파일을 쓰지 않음 (http_cache와 같은 방식)
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _save_manifest(manifest):
+    # locked() 안에서 읽은 manifest만 저장 (다른 프로세스의 갱신을 덮어쓰지 않도록)
+    write_json(MANIFEST_PATH, manifest)
+
+
+def dataset_version(name):
+    """데이터셋 버전 (캐시 키 용도). 저장소에 없으면 None"""
+    entry = load_manifest()['datasets'].get(name)
+    return entry['version'] if entry else None
+
+
+def dataset_revisions(name):
+    """
+    데이터셋 변경 이력 [{'version', 'start', 'end'}]. 첫 항목은 전체를 새로 쓴 버전(start/end 없음),
+    나머지는 append_dataset으로 추가한 날짜 범위(ISO 문자열). 저장소에 없으면 빈 리스트
+    """
+    entry = load_manifest()['datasets'].get(name)
+    if entry is None:
+        return []
+    base = {'version': entry.get('base_version', entry['version']), 'start': None, 'end': None}
+    return [base] + [
+        {'version': part['version'], 'start': part['start'], 'end': part['end']}
+        for part in entry.get('parts', [])
+    ]
+
+
+def _remove_files(entry, keep=None):
+    for file_name in [entry['file']] + [part['file'] for part in entry.get('parts', [])]:
+        if file_name == keep:
+            continue
+        try:
+            os.remove(os.path.join(STORE_DIR, file_name))
+        except OSError:
+            pass
+
+
+def write_dataset(name, df):
+    """
+    데이터셋을 새 버전의 Parquet 파일로 저장하고 manifest 갱신.
+    이전 버전 파일은 manifest 교체 후 삭제. 전체를 저장소 잠금 안에서 함
+    """
+    with locked():
+        df = coerce(df, name)
+
+        manifest = load_manifest()
+        version = manifest['version'] + 1
+        file_name = f"{name}-v{version}.parquet"
+        path = os.path.join(STORE_DIR, file_name)
+        df.to_parquet(path, index=False)
+
+        previous = manifest['datasets'].get(name)
+        manifest['version'] = version
+        manifest['datasets'][name] = {
+            'version': version,
+            'base_version': version,
+            'file': file_name,
+            'sha256': _sha256(path),
+            'rows': len(df),
+            'columns': {col: str(dtype) for col, dtype in df.dtypes.items()},
+            'updated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        }
+        _save_manifest(manifest)
+
+        if previous:
+            _remove_files(previous, keep=file_name)
+        return version
+
+
+def append_dataset(name, df, date_col='date'):
+    """
+    기존 데이터셋 뒤에 행을 추가. 기존 파일은 그대로 두고 추가분만 새 part 파일로 저장하므로
+    비용은 추가하는 행 수에 비례함. 데이터셋이 없으면 write_dataset과 같음
+    """
+    with locked():
+        manifest = load_manifest()
+        entry = manifest['datasets'].get(name)
+        if entry is None:
+            return write_dataset(name, df)
+        if len(entry.get('parts', [])) >= MAX_PARTS:
+            # part가 너무 많아지면 한 번 합쳐서 새로 씀
+            combined = read_dataset(name, verify=False)
+            if combined is not None:
+                return write_dataset(name, pd.concat([combined, coerce(df, name)], ignore_index=True))
+
+        df = coerce(df, name)
+        version = manifest['version'] + 1
+        file_name = f"{name}-v{version}.parquet"
+        path = os.path.join(STORE_DIR, file_name)
+        df.to_parquet(path, index=False)
+
+        dates = pd.to_datetime(df[date_col])
+        # 이전 manifest에는 base_version이 없으므로 추가 전 버전을 기본 파일 버전으로 봄
+        entry.setdefault('base_version', entry['version'])
+        manifest['version'] = version
+        entry['version'] = version
+        entry.setdefault('parts', []).append({
+            'file': file_name,
+            'version': version,
+            'sha256': _sha256(path),
+            'rows': len(df),
+            'start': dates.min().strftime('%Y-%m-%d'),
+            'end': dates.max().strftime('%Y-%m-%d'),
+        })
+        entry['rows'] += len(df)
+        entry['updated_at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        _save_manifest(manifest)
+        return version
+
+
+def read_dataset(name, verify=True):
+    """
+    저장소에서 데이터셋 읽기.
+    파일이 없거나 체크섬이 맞지 않으면 None 반환 (호출하는 쪽에서 원격/기본 데이터 사용)
+    """
+    entry = load_manifest()['datasets'].get(name)
+    if entry is None:
+        return None
+
+    # 기본 파일 + append_dataset으로 추가한 part 파일들을 순서대로 이어 붙임
+    files = [(entry['file'], entry['sha256'])] + [(part['file'], part['sha256']) for part in entry.get('parts', [])]
+    frames = []
+    try:
+        for file_name, sha256 in files:
+            path = os.path.join(STORE_DIR, file_name)
+            if verify and _sha256(path) != sha256:
+                print(f"[store] {name}: 체크섬 불일치 ({file_name}), 무시합니다")
+                return None
+            frames.append(pd.read_parquet(path))
+    except (OSError, ValueError) as e:
+        print(f"[store] {name}: 읽기 실패 ({e})")
+        return None
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def build_from_remote(base_url=REMOTE_BASE_URL):
+    """원격 CSV(timeline.csv, cities.csv)를 받아서 저장소에 기록"""
+    timeline = pd.read_csv(base_url + "timeline.csv")
+    cities = pd.read_csv(base_url + "cities.csv")
+    write_dataset('timeline', timeline)
+    write_dataset('cities', cities)
+
+
+if __name__ == "__main__":
+    # 사용법: python store.py build | verify
+    command = sys.argv[1] if len(sys.argv) > 1 else 'verify'
+
+    if command == 'build':
+        build_from_remote()
+
+    manifest = load_manifest()
+    for name, entry in manifest['datasets'].items():
+        ok = read_dataset(name) is not None
+        print(f"{name:10s} v{entry['version']:<4d} rows={entry['rows']:<6d} {'OK' if ok else 'BROKEN'}")
@@ -0,0 +1,132 @@
+# synthetic.py 시드 고정 합성 데이터 생성 (오프라인 기본 데이터 / 부하 테스트용)
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 2020
+START_DATE = '2020-01-01'
+DAYS = 2195
+
+# 유행 단계: (단계가 끝나는 날, 하루 평균 신규 확진자). 마지막 단계는 끝까지 이어짐
+DEFAULT_PHASES = [
+    (60, 500),
+    (365, 50000),
+    (730, 100000),
+    (None, 200000),
+]
+
+# 누적 사망자 = 누적 확진자 × CFR
+CFR = 0.009
+
+# 주요 국가별 누적 확진 차트의 국가와 배율 (전 세계 타임라인 × 배율)
+COUNTRY_MULTIPLIERS = {
+    '미국': 1.0,
+    '인도': 0.8,
+    '브라질': 0.6,
+    '프랑스': 0.4,
+    '독일': 0.35,
+    '영국': 0.38,
+    '한국': 0.15
+}
+
+# 저장소에 도시 데이터가 없을 때 쓰는 기본 도시 목록
+DEFAULT_CITIES = [
+    {'name': 'Wuhan', 'lat': 30.5928, 'lon': 114.3055, 'cases': 50000},
+    {'name': 'Seoul', 'lat': 37.5665, 'lon': 126.9780, 'cases': 150000},
+    {'name': 'New York', 'lat': 40.7128, 'lon': -74.0060, 'cases': 1000000},
+    {'name': 'London', 'lat': 51.5074, 'lon': -0.1278, 'cases': 500000},
+    {'name': 'Tokyo', 'lat': 35.6762, 'lon': 139.6503, 'cases': 300000},
+    {'name': 'Paris', 'lat': 48.8566, 'lon': 2.3522, 'cases': 400000},
+    {'name': 'Sao Paulo', 'lat': -23.5505, 'lon': -46.6333, 'cases': 600000},
+    {'name': 'Mumbai', 'lat': 19.0760, 'lon': 72.8777, 'cases': 450000},
+    {'name': 'Sydney', 'lat': -33.8688, 'lon': 151.2093, 'cases': 200000},
+    {'name': 'Moscow', 'lat': 55.7558, 'lon': 37.6173, 'cases': 350000}
+]
+
+
+def daily_means(days=DAYS, phases=DEFAULT_PHASES):
+    """날짜별 평균 신규 확진자 배열 (길이 days)"""
+    ends = np.array([end if end is not None else days for end, _ in phases])
+    means = np.array([mean for _, mean in phases], dtype=np.float64)
+    # 각 날짜가 몇 번째 단계에 속하는지 한 번에 계산
+    phase_idx = np.searchsorted(ends, np.arange(days), side='right')
+    return means[np.minimum(phase_idx, len(means) - 1)]
+
+
+def generate_cases(n_series, days=DAYS, seed=DEFAULT_SEED, phases=DEFAULT_PHASES, weights=None):
+    """
+    (n_series × days) 누적 확진자 행렬을 NumPy 호출 몇 번으로 생성.
+    weights는 시리즈별 규모 배율 (없으면 1)
+    """
+    rng = np.random.default_rng(seed)
+    scale = daily_means(days, phases)[np.newaxis, :]
+    if weights is not None:
+        scale = scale * np.asarray(weights, dtype=np.float64)[:, np.newaxis]
+    daily = rng.exponential(1.0, size=(n_series, days)) * scale
+    return np.cumsum(daily, axis=1).astype(np.int64)
+
+
+def generate_timeline(days=DAYS, seed=DEFAULT_SEED, phases=DEFAULT_PHASES, start=START_DATE):
+    """전 세계 누적 타임라인 (date, cases, deaths)"""
+    cases = generate_cases(1, days, seed, phases)[0]
+    return pd.DataFrame({
+        'date': pd.date_range(start=start, periods=days),
+        'cases': cases,
+        'deaths': (cases * CFR).astype(np.int64),
+    })
+
+
+def generate_countries(n_countries, days=DAYS, seed=DEFAULT_SEED, phases=DEFAULT_PHASES, start=START_DATE):
+    """
+    국가별 누적 타임라인 (long 형식: date, country, cases, deaths).
+    국가 규모는 로그정규분포로 뽑아서 큰 나라/작은 나라가 섞이게 함
+    """
+    rng = np.random.default_rng(seed + 1)
+    weights = rng.lognormal(mean=-3.0, sigma=1.2, size=n_countries)
+    cases = generate_cases(n_countries, days, seed, phases, weights)
+    dates = pd.date_range(start=start, periods=days)
+    names = np.array([f"Country {i:03d}" for i in range(n_countries)])
+    return pd.DataFrame({
+        'date': np.tile(dates.values, n_countries),
+        'country': np.repeat(names, days),
+        'cases': cases.ravel(),
+        'deaths': (cases.ravel() * CFR).astype(np.int64),
+    })
+
+
+def generate_cities(n_cities, seed=DEFAULT_SEED):
+    """지구본 마커용 도시 목록 (name, lat, lon, cases)"""
+    rng = np.random.default_rng(seed + 2)
+    # 위도는 구면에서 균등하게 분포하도록 arcsin 사용
+    lat = np.degrees(np.arcsin(rng.uniform(-1, 1, n_cities)))
+    lon = rng.uniform(-180, 180, n_cities)
+    cases = rng.lognormal(mean=12, sigma=1.0, size=n_cities).astype(np.int64)
+    return pd.DataFrame({
+        'name': [f"City {i:04d}" for i in range(n_cities)],
+        'lat': lat.round(4),
+        'lon': lon.round(4),
+        'cases': cases,
+    })
+
+
+if __name__ == "__main__":
+    # 예) 현재 데이터의 100배 규모로 저장소 생성 후 대시보드 부하 테스트
+    #   COVID_STORE_DIR=/tmp/covid_store python synthetic.py --countries 100 --cities 1000
+    #   COVID_STORE_DIR=/tmp/covid_store streamlit run app.py
+    parser = argparse.ArgumentParser(description='합성 데이터로 로컬 데이터셋 저장소 생성')
+    parser.add_argument('--days', type=int, default=DAYS)
+    parser.add_argument('--countries', type=int, default=100)
+    parser.add_argument('--cities', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    import store
+
+    timeline = generate_timeline(args.days, args.seed)
+    countries = generate_countries(args.countries, args.days, args.seed)
+    store.write_dataset('timeline', timeline)
+    store.write_dataset('cities', generate_cities(args.cities, args.seed))
+    store.write_dataset('countries', countries)
+    print(f"timeline {len(timeline):,}행, countries {len(countries):,}행, cities {args.cities:,}개 -> {store.STORE_DIR}")
@@ -0,0 +1,69 @@
+# test_serialization.py serialization 모듈 테스트 (python -m pytest test_serialization.py)
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import compact
+import figspec
+import figure_cache
+import serialization
+import traces
+
+
+def _merged_date_spec(n_series=30, days=5):
+    """MERGE_THRESHOLD보다 많은 국가 선 차트 (날짜 축에 NaT 간격이 들어감)"""
+    frame = compact.compact_frame(pd.DataFrame({'date': pd.date_range('2020-01-01', periods=days)}))
+    x = compact.dates(frame).to_numpy()
+    xs = [x] * n_series
+    ys = [np.arange(days) * (i + 1) for i in range(n_series)]
+    names = [f'국가 {i}' for i in range(n_series)]
+    colors = ['#60a5fa', '#f472b6'] * (n_series // 2)
+    return figspec.figure(traces.lines(xs, ys, names, colors))
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def engine(request, monkeypatch):
+    if request.param == 'orjson' and serialization.orjson is None:
+        pytest.skip('orjson이 설치되지 않음')
+    if request.param == 'json':
+        monkeypatch.setattr(serialization, 'orjson', None)
+    return request.param
+
+
+def test_merged_lines_date_gaps(engine):
+    spec = _merged_date_spec()
+    x = json.loads(serialization.dumps(spec))['data'][0]['x']
+    # 시리즈 15개(색상 하나) × 5일 + 사이 간격 14개
+    assert len(x) == 15 * 5 + 14
+    assert x[:6] == ['2020-01-01T00:00:00', '2020-01-02T00:00:00', '2020-01-03T00:00:00',
+                     '2020-01-04T00:00:00', '2020-01-05T00:00:00', None]
+    assert x.count(None) == 14
+
+
+def test_merged_lines_through_figure_cache():
+    cache = figure_cache.FigureCache()
+    fig = cache.figure('merged', 1, 'dark', _merged_date_spec)
+    for trace in fig.to_dict()['data']:
+        assert None in trace['x']
+        assert all(value is None or value.startswith('2020-01-0') for value in trace['x'])
+
+
+@pytest.mark.parametrize('unit', ['D', 's', 'ms', 'ns'])
+def test_nat_is_null(engine, unit):
+    values = np.array(['2020-01-02', 'NaT', '2020-01-03'], dtype=f'datetime64[{unit}]')
+    expected = '["2020-01-02T00:00:00",null,"2020-01-03T00:00:00"]'
+    assert serialization.dumps(values) == expected
+    # 연속되지 않은 배열, Series, 스칼라
+    assert serialization.dumps(values[::2]) == '["2020-01-02T00:00:00","2020-01-03T00:00:00"]'
+    assert serialization.dumps({'x': pd.Series(values)}) == '{"x":' + expected + '}'
+    assert serialization.dumps([values[1], values[0]]) == '[null,"2020-01-02T00:00:00"]'
+
+
+def test_input_not_modified():
+    values = np.array(['2020-01-02', 'NaT'], dtype='datetime64[s]')
+    spec = {'data': [{'x': values}]}
+    serialization.dumps(spec)
+    assert spec['data'][0]['x'] is values
@@ -0,0 +1,86 @@
+# traces.py 점 개수에 따라 SVG(scatter) / WebGL(scattergl) 트레이스 스펙을 고르는 팩토리
+
+import numpy as np
+
+import figspec
+
+# 차트 하나의 점이 이 개수를 넘으면 WebGL로 그림 (SVG는 수만 개부터 브라우저가 멈춤)
+WEBGL_THRESHOLD = 10000
+
+# 시리즈가 이 개수를 넘으면 색상별로 트레이스 하나로 합침 (범례 대신 호버에 이름 표시)
+MERGE_THRESHOLD = 20
+
+MERGED_HOVERTEMPLATE = '<b>%{customdata}</b><br>%{x}<br>%{y:,}<extra></extra>'
+
+
+def use_webgl(n_points, threshold=WEBGL_THRESHOLD):
+    return n_points > threshold
+
+
+def scatter(x, y, webgl=None, threshold=WEBGL_THRESHOLD, **kwargs):
+    """
+    go.Scatter와 같은 인자로 트레이스 스펙(dict) 생성. 점이 threshold보다 많으면 scattergl.
+    webgl=True/False로 강제할 수 있음. 스타일/호버 템플릿 인자는 그대로 전달
+    """
+    if webgl is None:
+        webgl = use_webgl(len(x), threshold)
+    return figspec.trace('scattergl' if webgl else 'scatter', x=x, y=y, **kwargs)
+
+
+def _concat_with_gaps(arrays):
+    """시리즈 사이에 NaN(날짜는 NaT)을 끼워 한 배열로 이어 붙임 (선이 이어지지 않게)"""
+    arrays = [np.asarray(a) for a in arrays]
+    if np.issubdtype(arrays[0].dtype, np.datetime64):
+        gap = np.array(['NaT'], dtype=arrays[0].dtype)
+    else:
+        arrays = [a.astype(np.float64) for a in arrays]
+        gap = np.array([np.nan])
+    parts = []
+    for a in arrays:
+        parts.append(a)
+        parts.append(gap)
+    return np.concatenate(parts[:-1])
+
+
+def merged_lines(xs, ys, names, colors, width=2, **kwargs):
+    """
+    시리즈 여러 개를 색상별로 WebGL 트레이스 하나씩으로 합침.
+    WebGL 선은 트레이스마다 색이 하나라서 같은 색끼리 묶고, 시리즈 이름은 customdata로 호버에 표시.
+    반환: 트레이스 목록 (색상 개수만큼)
+    """
+    hovertemplate = kwargs.pop('hovertemplate', MERGED_HOVERTEMPLATE)
+    groups = {}
+    for x, y, name, color in zip(xs, ys, names, colors):
+        groups.setdefault(color, []).append((x, y, name))
+
+    result = []
+    for color, members in groups.items():
+        customdata = np.concatenate([
+            np.append(np.full(len(x), name, dtype=object), None) for x, _, name in members
+        ])[:-1]
+        result.append(figspec.scattergl(
+            x=_concat_with_gaps([x for x, _, _ in members]),
+            y=_concat_with_gaps([y for _, y, _ in members]),
+            customdata=customdata,
+            mode='lines',
+            line=dict(color=color, width=width),
+            connectgaps=False,
+            hovertemplate=hovertemplate,
+            showlegend=False,
+            **kwargs,
+        ))
+    return result
+
+
+def lines(xs, ys, names, colors, merge_threshold=MERGE_THRESHOLD, width=2, **kwargs):
+    """
+    국가별 선 차트 트레이스 목록.
+    시리즈가 적으면 시리즈마다 트레이스 하나 (전체 점 개수로 SVG/WebGL 결정), 많으면 merged_lines로 합침
+    """
+    if len(names) > merge_threshold:
+        return merged_lines(xs, ys, names, colors, width=width, **kwargs)
+    webgl = use_webgl(sum(len(x) for x in xs))
+    return [
+        scatter(x, y, webgl=webgl, mode='lines', name=name, line=dict(color=color, width=width), **kwargs)
+        for x, y, name, color in zip(xs, ys, names, colors)
+    ]
@@ -1,41 +1,63 @@
 # utils.py 데이터 로딩 및 공통 함수
 
 # utils.py 데이터 로딩 및 공통 함수
-import streamlit as st
 import pandas as pd
 import numpy as np
-import requests
 
-@st.cache_data
+import ingest
+import refresher
+import store
+
+
+def _mock_timeline():
+    """API/저장소 모두 사용할 수 없을 때 쓰는 더미 데이터"""
+    dates = pd.date_range(start='2020-01-22', periods=100)
+    return pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'cases': np.linspace(0, 1000000, 100),
+        'deaths': np.linspace(0, 50000, 100)
+    })
+
+
+def _load_timeline_remote():
+    """
+    disease.sh API에서 마지막으로 받은 날 이후만 받아서 저장소에 추가한 뒤 최근 30일 반환 (실패하면 예외).
+    매일 갱신할 때 받는 양은 하루치 (처음 한 번만 전체 기록)
+    """
+    ingest.ingest_disease_sh()
+    stored = store.read_dataset('historical_all')
+    if stored is None or stored.empty:
+        raise Exception("API Error")
+    timeline = stored.tail(30).reset_index(drop=True)
+    timeline['date'] = timeline['date'].dt.strftime('%Y-%m-%d')
+    return timeline[['date', 'cases', 'deaths']]
+
+
+def _load_timeline_local():
+    """로컬 데이터셋 저장소(data/store)의 최근 30일 (disease.sh 적재분 우선), 없으면 더미 데이터"""
+    stored = store.read_dataset('historical_all')
+    if stored is None:
+        stored = store.read_dataset('timeline')
+    if stored is None:
+        return _mock_timeline(), 'fallback'
+    timeline = stored.tail(30).reset_index(drop=True)
+    timeline['date'] = timeline['date'].dt.strftime('%Y-%m-%d')
+    return timeline[['date', 'cases', 'deaths']], 'store'
+
+
 def load_data():
     """
     데이터 로딩 함수. 
-    1. API/CSV 로드 시도
-    2. 실패 시 시뮬레이션용 더미 데이터 생성
+    1. 로컬 데이터셋 저장소(data/store) 우선
+    2. API 갱신은 백그라운드 스레드에서 (요청 스레드는 기다리지 않음)
+    3. 둘 다 없으면 시뮬레이션용 더미 데이터 생성
     """
     data = {}
     
-    # 1. Timeline Data (API or Mock)
-    try:
-        # 실제 API 연결 시도 (타임아웃 설정)
-        response = requests.get('https://disease.sh/v3/covid-19/historical/all?lastdays=30', timeout=2)
-        if response.status_code == 200:
-            json_data = response.json()
-            cases = pd.DataFrame(list(json_data['cases'].items()), columns=['date', 'cases'])
-            deaths = pd.DataFrame(list(json_data['deaths'].items()), columns=['date', 'deaths'])
-            timeline = pd.merge(cases, deaths, on='date')
-            timeline['date'] = pd.to_datetime(timeline['date']).dt.strftime('%Y-%m-%d')
-            data['timeline'] = timeline
-        else:
-            raise Exception("API Error")
-    except:
-        # 실패 시 더미 데이터 생성
-        dates = pd.date_range(start='2020-01-22', periods=100)
-        data['timeline'] = pd.DataFrame({
-            'date': dates.strftime('%Y-%m-%d'),
-            'cases': np.linspace(0, 1000000, 100),
-            'deaths': np.linspace(0, 50000, 100)
-        })
+    # 1. Timeline Data (Store, API or Mock)
+    data['timeline'] = refresher.get_refresher(
+        'disease_sh_timeline', _load_timeline_local, _load_timeline_remote
+    ).snapshot().data
 
     # 2. Symptoms Data (Mock)
     data['symptoms'] = pd.DataFrame({